@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from candidates import BoardCandidates  # noqa: E402
+from game_type import GUESSES, WORDS  # noqa: E402
+from scoring import get_pattern  # noqa: E402
+from word_painter import _WordPainterNoGui  # noqa: E402
+
+GUESSES_TIMED = 200
+
+
+def paint_largest_bucket(word_input: str, candidates: List[str]) -> str:
+    buckets: Dict[str, List[str]] = {}
+    for word in candidates:
+        painted = _WordPainterNoGui(
+            word_input, get_pattern(word_input, word)
+            ).get_painted_word()
+        buckets.setdefault(painted, []).append(word)
+    return max(buckets.values(), key=len)[0]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    guesses = rng.sample(GUESSES, GUESSES_TIMED)
+
+    start = time.perf_counter()
+    for word_input in guesses:
+        paint_largest_bucket(word_input, WORDS)
+    painting = (time.perf_counter() - start) / len(guesses)
+
+    board_candidates = BoardCandidates(WORDS[:1])
+    start = time.perf_counter()
+    for word_input in guesses:
+        board_candidates.retarget(word_input)
+    counting = (time.perf_counter() - start) / len(guesses)
+
+    print(f"largest bucket over {len(WORDS)} candidates, first guess")
+    print(f"painting every candidate {painting * 1e3:8.3f} ms per guess")
+    print(f"pattern row + bincount   {counting * 1e3:8.3f} ms per guess")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import GUESSES, WORDS  # noqa: E402
+from scoring import score_batch, score_pairs  # noqa: E402
+from word_painter import get_painted_words, paint_pattern  # noqa: E402
+
+PAIRS = 100_000
+BATCH_GUESSES = 1000
+
+
+def report(name: str, pairs: int, elapsed: float) -> None:
+    print(f"{name:36} {pairs / elapsed:14,.0f} pairs/s")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    guesses = [rng.choice(GUESSES) for _ in range(PAIRS)]
+    answers = [rng.choice(WORDS) for _ in range(PAIRS)]
+    score_pairs(guesses[:10], answers[:10])
+
+    start = time.perf_counter()
+    for word_input, correct_word in zip(guesses, answers):
+        get_painted_words(word_input, [correct_word], [False])
+    report("get_painted_words, one pair a call", PAIRS,
+           time.perf_counter() - start)
+
+    start = time.perf_counter()
+    patterns = score_pairs(guesses, answers)
+    report("score_pairs", PAIRS, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for word_input, pattern in zip(guesses, patterns.tolist()):
+        paint_pattern(word_input, pattern)
+    report("ANSI rendering from codes", PAIRS,
+           time.perf_counter() - start)
+
+    batch = guesses[:BATCH_GUESSES]
+    start = time.perf_counter()
+    score_batch(batch, WORDS)
+    report(f"score_batch {len(batch)} x {len(WORDS)}",
+           len(batch) * len(WORDS), time.perf_counter() - start)
+
+    unknown = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz")
+                       for _ in range(5)) for _ in range(BATCH_GUESSES)]
+    start = time.perf_counter()
+    score_batch(unknown, WORDS)
+    report(f"score_batch {len(unknown)} unlisted x {len(WORDS)}",
+           len(unknown) * len(WORDS), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
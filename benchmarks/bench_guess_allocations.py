@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from functools import partial
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import WORDS, Quordle  # noqa: E402
+from guessing_process import GuessingProcessNoGui  # noqa: E402
+from scoring import get_pattern, score  # noqa: E402
+from word_painter import get_painted_words  # noqa: E402
+
+PAIRS = 5000
+
+
+def measure(calls: List[Callable[[], object]]) -> Tuple[float, float]:
+    for call in calls[:10]:
+        call()
+    transient = 0
+    tracemalloc.start()
+    for call in calls:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        call()
+        transient += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for call in calls:
+        call()
+    elapsed = time.perf_counter() - start
+    return transient / len(calls), elapsed / len(calls) * 1e6
+
+
+def main() -> None:
+    rng = random.Random(0)
+    pairs: List[Tuple[str, str]] = [
+        (rng.choice(WORDS), rng.choice(WORDS)) for _ in range(PAIRS)
+        ]
+
+    reference_scoring = [
+        partial(score, word_input, correct_word)
+        for word_input, correct_word in pairs
+        ]
+    array_scoring = [
+        partial(get_pattern, word_input, correct_word)
+        for word_input, correct_word in pairs
+        ]
+
+    guessing_process = GuessingProcessNoGui(Quordle(), WORDS[:4])
+    board_candidates = guessing_process.get_candidates()
+    painting = [
+        partial(get_painted_words, word_input, WORDS[:4], [False] * 4)
+        for word_input, _ in pairs
+        ]
+    narrowing = [
+        partial(board_candidates.narrow, word_input)
+        for word_input, _ in pairs
+        ]
+
+    for name, calls in (
+            ("dict/list scoring, one pair", reference_scoring),
+            ("array lookup, one pair", array_scoring),
+            ("quordle painting, one guess", painting),
+            ("quordle narrowing, one guess", narrowing)):
+        transient, micros = measure(calls)
+        print(f"{name:30} {transient:8.0f} bytes allocated"
+              f" {micros:8.2f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import WORDS, GameType, NBoardGame  # noqa: E402
+from scoring import decode_pattern, get_patterns  # noqa: E402
+from word_painter_gui import GUI_COLORS, LETTER_FONT  # noqa: E402
+
+BOARD_COUNTS = (1, 2, 4)
+ROUNDS = 20
+
+
+class CountingTk:
+
+    def __init__(self, tk) -> None:
+        self._tk = tk
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def eval(self, script: str):
+        self.calls += 1
+        return self._tk.eval(script)
+
+    def __getattr__(self, name: str):
+        return getattr(self._tk, name)
+
+
+def paint_per_label(labels, word_input: str,
+                    correct_words: List[str]) -> None:
+    patterns = get_patterns(word_input, correct_words)
+    for index, pattern in enumerate(patterns):
+        for label, letter, color in zip(labels[index], word_input,
+                                        decode_pattern(pattern)):
+            label.config(text=letter.upper(), fg=GUI_COLORS[color],
+                         font=LETTER_FONT)
+
+
+def measure(game_type: GameType, rng: random.Random) -> None:
+    from tkinter import Tk
+
+    from main_gui import GameGui
+
+    root = Tk()
+    counter = CountingTk(root.tk)
+    root.tk = counter  # type: ignore
+    number_of_words = game_type.get_number_of_words()
+    guesses = rng.sample(WORDS, game_type.get_max_guesses())
+    correct_words = rng.sample(WORDS, number_of_words)
+    game_gui = GameGui(root, game_type)
+    root.update()
+
+    counter.calls = 0
+    for guess_number, word_input in enumerate(guesses):
+        paint_per_label(game_gui.labels[guess_number], word_input,
+                        correct_words)
+    per_label_calls = counter.calls / len(guesses)
+
+    counter.calls = 0
+    for guess_number, word_input in enumerate(guesses):
+        game_gui.board_view.paint_row(guess_number, word_input,
+                                      correct_words,
+                                      [False] * number_of_words)
+    batched_calls = counter.calls / len(guesses)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for widget in root.winfo_children():
+            widget.destroy()
+        game_gui = GameGui(root, game_type)
+        root.update()
+    rebuild = (time.perf_counter() - start) / ROUNDS
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        game_gui.reset()
+        root.update()
+    reset = (time.perf_counter() - start) / ROUNDS
+    root.destroy()
+
+    print(f"{number_of_words} boards: Tcl calls per guess"
+          f" {per_label_calls:6.1f} per label, {batched_calls:4.1f} batched;"
+          f" retry {rebuild * 1e3:7.2f} ms rebuilt,"
+          f" {reset * 1e3:6.2f} ms reset in place")
+
+
+def main() -> None:
+    from tkinter import TclError, Tk
+
+    try:
+        Tk().destroy()
+    except TclError:
+        print("no display available, run under Xvfb (xvfb-run -a ...)")
+        return
+
+    rng = random.Random(0)
+    for number_of_words in BOARD_COUNTS:
+        measure(NBoardGame(number_of_words), rng)
+
+
+if __name__ == "__main__":
+    main()
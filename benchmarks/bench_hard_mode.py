@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import GUESSES, WORDS  # noqa: E402
+from hard_mode import LetterConstraints  # noqa: E402
+from scoring import score  # noqa: E402
+
+HISTORIES = 20
+HISTORY_LENGTH = 3
+
+
+def replay_allows(history: List[Tuple[str, int]], word: str) -> bool:
+    return all(score(guess, word) == pattern for guess, pattern in history)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    replay = 0.0
+    bitwise = 0.0
+    vectorized = 0.0
+    checks = 0
+    for _ in range(HISTORIES):
+        correct_word = rng.choice(WORDS)
+        history = [
+            (guess, score(guess, correct_word))
+            for guess in rng.sample(GUESSES, HISTORY_LENGTH)
+            ]
+        constraints = LetterConstraints()
+        for guess, pattern in history:
+            constraints.add_feedback(guess, pattern)
+
+        start = time.perf_counter()
+        expected = [replay_allows(history, word) for word in GUESSES]
+        replay += time.perf_counter() - start
+
+        start = time.perf_counter()
+        allowed = [constraints.allows(word) for word in GUESSES]
+        bitwise += time.perf_counter() - start
+
+        start = time.perf_counter()
+        mask = constraints.legal_mask()
+        vectorized += time.perf_counter() - start
+
+        assert allowed == expected, correct_word
+        assert mask.tolist() == expected, correct_word
+        checks += len(GUESSES)
+
+    print(f"{checks} checks after {HISTORY_LENGTH} guesses each")
+    print(f"replaying feedback  {replay / checks * 1e6:8.3f} us per check")
+    print(f"bitwise constraints {bitwise / checks * 1e6:8.3f} us per check")
+    print(f"vectorized listing  {vectorized / HISTORIES * 1e3:8.3f} ms"
+          f" per full legal-guess list")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+MODULES = ["game_type", "main", "main_gui"]
+
+
+def import_seconds(statement: str, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True,
+                       cwd=PACKAGE_DIR)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the cold import time of the game modules."
+        )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = import_seconds("pass", args.runs)
+    print(f"interpreter start-up: {baseline * 1000:7.1f} ms")
+    for module in MODULES:
+        elapsed = import_seconds(f"import {module}", args.runs)
+        print(f"import {module:10} {(elapsed - baseline) * 1000:7.1f} ms")
+
+    load = "import game_type; game_type.WORDS"
+    elapsed = import_seconds(load, args.runs)
+    print(f"word load         {(elapsed - baseline) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
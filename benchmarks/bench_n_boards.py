@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import WORDS, GameType, NBoardGame  # noqa: E402
+from guessing_process import GuessingProcessNoGui  # noqa: E402
+from word_painter import get_painted_words  # noqa: E402
+
+BOARD_COUNTS = (4, 8, 16, 32)
+GAMES = 20
+
+
+def headless(game_type: GameType, games: List[List[str]],
+             guesses: List[str]) -> None:
+    setup = 0.0
+    guessing = 0.0
+    for correct_words in games:
+        start = time.perf_counter()
+        guessing_process = GuessingProcessNoGui(game_type, correct_words)
+        setup += time.perf_counter() - start
+        start = time.perf_counter()
+        for word_input in guesses:
+            get_painted_words(word_input, correct_words,
+                              guessing_process.get_were_words_guessed())
+            guessing_process.make_guess(word_input)
+        guessing += time.perf_counter() - start
+    number_of_words = game_type.get_number_of_words()
+    print(f"{number_of_words:3} boards headless"
+          f" {setup / len(games) * 1e3:8.3f} ms setup"
+          f" {guessing / len(games) / len(guesses) * 1e3:8.3f} ms per guess")
+
+
+def gui(game_type: GameType, correct_words: List[str],
+        guesses: List[str]) -> None:
+    from tkinter import Frame, Tk, TclError
+
+    from board_view import CanvasBoardView, LabelBoardView
+    from main_gui import generate_labels
+
+    try:
+        root = Tk()
+    except TclError:
+        print("no display available, skipping GUI cases")
+        return
+
+    number_of_words = game_type.get_number_of_words()
+    for name, make_view in (
+            ("label grid", lambda frame: LabelBoardView(
+                generate_labels(frame, game_type))),
+            ("canvas", lambda frame: CanvasBoardView(frame, game_type))):
+        frame = Frame(root)
+        frame.pack()
+        start = time.perf_counter()
+        view = make_view(frame)
+        root.update()
+        setup = time.perf_counter() - start
+        start = time.perf_counter()
+        for guess_number, word_input in enumerate(guesses):
+            view.paint_row(guess_number, word_input, correct_words,
+                           [False] * number_of_words)
+            root.update()
+        painting = time.perf_counter() - start
+        frame.destroy()
+        print(f"{number_of_words:3} boards {name:10}"
+              f" {setup * 1e3:8.3f} ms setup"
+              f" {painting / len(guesses) * 1e3:8.3f} ms per guess")
+    root.destroy()
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for number_of_words in BOARD_COUNTS:
+        game_type = NBoardGame(number_of_words)
+        games = [rng.sample(WORDS, number_of_words) for _ in range(GAMES)]
+        guesses = rng.sample(WORDS, game_type.get_max_guesses())
+        headless(game_type, games, guesses)
+        gui(game_type, games[0], guesses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import GUESSES, WORDS  # noqa: E402
+from scoring import CHUNK_SIZE, build_pattern_matrix_file  # noqa: E402
+
+
+def synthetic_guesses(total: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    guesses = list(GUESSES)
+    seen = set(guesses)
+    while len(guesses) < total:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(5))
+        if word not in seen:
+            seen.add(word)
+            guesses.append(word)
+    return guesses
+
+
+def peak_rss_mb() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the chunked pattern matrix build."
+        )
+    parser.add_argument("--guesses", type=int, default=13000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    guesses = synthetic_guesses(max(args.guesses, len(GUESSES)))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "patterns.npy"
+        start = time.perf_counter()
+        build_pattern_matrix_file(guesses, WORDS, path,
+                                  args.chunk_size, args.workers)
+        elapsed = time.perf_counter() - start
+        size_mb = path.stat().st_size / 2 ** 20
+
+    print(f"matrix: {len(guesses)} x {len(WORDS)} ({size_mb:.1f} MB)")
+    print(f"build time: {elapsed:.2f} s")
+    print(f"peak RSS (max of parent, largest worker): {peak_rss_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import GUESSES  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+GAMES = 2000
+LOCKSTEP_GUESSES = 2000
+
+
+def start_engine() -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, str(ROOT / "main.py"), "--protocol",
+         "--game", "wordle", "--seed", "0"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0
+        )
+
+
+def random_guesses(count: int) -> List[bytes]:
+    rng = random.Random(1)
+    return [rng.choice(GUESSES).encode() for _ in range(count)]
+
+
+def pipelined() -> float:
+    guesses = random_guesses(6 * GAMES)
+    engine = start_engine()
+    assert engine.stdin is not None and engine.stdout is not None
+    engine.stdin.write(b"crane\n")
+    engine.stdout.readline()
+
+    start = time.perf_counter()
+    output, _ = engine.communicate(b"\n".join(guesses) + b"\n")
+    elapsed = time.perf_counter() - start
+    games = sum(line.endswith(b" W") or b" L " in line
+                for line in output.splitlines())
+    print(f"pipelined: {len(guesses) / elapsed:,.0f} guesses/s,"
+          f" {games} games in {elapsed:.2f} s")
+    return elapsed
+
+
+def lockstep() -> float:
+    guesses = random_guesses(LOCKSTEP_GUESSES)
+    engine = start_engine()
+    assert engine.stdin is not None and engine.stdout is not None
+    engine.stdin.write(b"crane\n")
+    engine.stdout.readline()
+
+    start = time.perf_counter()
+    for word_input in guesses:
+        engine.stdin.write(word_input + b"\n")
+        engine.stdout.readline()
+    elapsed = time.perf_counter() - start
+    engine.stdin.close()
+    engine.wait()
+    print(f"lockstep: {len(guesses) / elapsed:,.0f} guesses/s,"
+          f" {elapsed / len(guesses) * 1e6:.0f} us per round trip")
+    return elapsed
+
+
+def main() -> None:
+    pipelined()
+    lockstep()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PACKAGE_DIR))
+
+from game_type import WORDS  # noqa: E402
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+async def request(reader: asyncio.StreamReader,
+                  writer: asyncio.StreamWriter, message: dict) -> dict:
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+
+async def client(connection: Connection, game: str, sessions: int,
+                 seed: int, latencies: List[float]) -> None:
+    rng = random.Random(seed)
+    reader, writer = connection
+    for _ in range(sessions):
+        reply = await request(reader, writer, {"op": "new", "game": game})
+        session = reply["session"]
+        finished = False
+        while not finished:
+            start = time.perf_counter()
+            reply = await request(reader, writer, {
+                "op": "guess", "session": session,
+                "word": rng.choice(WORDS)
+                })
+            latencies.append(time.perf_counter() - start)
+            finished = reply["finished"]
+    writer.close()
+
+
+async def wait_for_socket(unix_path: str) -> None:
+    for _ in range(200):
+        if Path(unix_path).exists():
+            return
+        await asyncio.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+async def run(game: str, clients: int, sessions: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        unix_path = str(Path(directory) / "wordle.sock")
+        server = subprocess.Popen(
+            [sys.executable, str(PACKAGE_DIR / "server.py"),
+             "--unix", unix_path]
+            )
+        try:
+            await wait_for_socket(unix_path)
+            connections = [await asyncio.open_unix_connection(unix_path)
+                           for _ in range(clients)]
+            latencies: List[float] = []
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                client(connection, game, sessions, seed, latencies)
+                for seed, connection in enumerate(connections)
+                ))
+            elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    total = clients * sessions
+    print(f"{game}: {clients} concurrent clients, {total} sessions,"
+          f" {len(latencies)} guesses in {elapsed:.2f} s")
+    print(f"  guess latency p50 {latencies[len(latencies) // 2] * 1e3:.2f} ms"
+          f"  p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms")
+    print(f"  {total / elapsed:.1f} sessions/s,"
+          f" {len(latencies) / elapsed:.1f} guesses/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load-test the game server over a Unix socket."
+        )
+    parser.add_argument("--game", default="wordle")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=10,
+                        help="sessions played by each client")
+    args = parser.parse_args()
+    asyncio.run(run(args.game, args.clients, args.sessions))
+
+
+if __name__ == "__main__":
+    main()
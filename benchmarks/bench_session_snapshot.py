@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import GUESSES, Quordle, Wordle  # noqa: E402
+from guessing_process import GuessingProcessNoGui  # noqa: E402
+from session_snapshot import SnapshotSlab  # noqa: E402
+
+SESSIONS = 2000
+GUESSES_PLAYED = 3
+
+
+def live_sessions(game_type, rng: random.Random
+                  ) -> List[GuessingProcessNoGui]:
+    sessions = []
+    for _ in range(SESSIONS):
+        guessing_process = GuessingProcessNoGui(game_type)
+        for _ in range(GUESSES_PLAYED):
+            guessing_process.make_guess(rng.choice(GUESSES))
+        sessions.append(guessing_process)
+    return sessions
+
+
+def main() -> None:
+    for game_type in (Wordle(seed=0), Quordle(seed=0)):
+        rng = random.Random(0)
+        tracemalloc.start()
+        sessions = live_sessions(game_type, rng)
+        live = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        slab = SnapshotSlab(game_type, capacity=SESSIONS)
+        start = time.perf_counter()
+        slots = [slab.park(session) for session in sessions]
+        parking = (time.perf_counter() - start) / SESSIONS
+        del sessions
+        start = time.perf_counter()
+        for slot in slots:
+            slab.unpark(slot)
+        unparking = (time.perf_counter() - start) / SESSIONS
+
+        name = type(game_type).__name__
+        print(f"{name:8} live {live / SESSIONS:9,.0f} bytes/session,"
+              f" parked {slab.dtype.itemsize} bytes/session;"
+              f" park {parking * 1e6:6.1f} us,"
+              f" unpark {unparking * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import random
+import string
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import WORDS  # noqa: E402
+from word_index import WordIndex  # noqa: E402
+
+LOOKUPS = 2000
+
+
+def synthetic_words(total: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    words = list(WORDS)
+    seen = set(words)
+    while len(words) < total:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(5))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words[:total]
+
+
+def per_call_us(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=3)) \
+        / number * 1e6
+
+
+def bench(size: int) -> None:
+    words = synthetic_words(size)
+    index = WordIndex(words)
+    rng = random.Random(1)
+    queries = [rng.choice(words) for _ in range(LOOKUPS // 2)]
+    queries += ["zzzzq"] * (LOOKUPS // 2)
+
+    def list_lookup():
+        for query in queries:
+            query in words
+
+    def index_lookup():
+        for query in queries:
+            query in index
+
+    def list_prefix():
+        [word for word in words if word.startswith("sta")][:10]
+
+    def index_prefix():
+        index.complete("sta")
+
+    def list_pattern():
+        [word for word in words if word[1] == "r" and word[4] == "e"][:10]
+
+    def index_pattern():
+        index.matching("?r??e")
+
+    print(f"{size} words")
+    print(f"  membership: list {per_call_us(list_lookup, 1) / LOOKUPS:8.3f} us"
+          f"  index {per_call_us(index_lookup, 1) / LOOKUPS:8.3f} us")
+    print(f"  prefix:     list {per_call_us(list_prefix, 50):8.1f} us"
+          f"  index {per_call_us(index_prefix, 50):8.1f} us")
+    print(f"  pattern:    list {per_call_us(list_pattern, 50):8.1f} us"
+          f"  index {per_call_us(index_pattern, 50):8.1f} us")
+
+
+if __name__ == "__main__":
+    for size in (2000, 15000):
+        bench(size)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PACKAGE_DIR))
+
+from game_type import (GUESSES, WORDS, Dordle, GameType, Quordle,  # noqa: E402
+                       Wordle, is_input_valid)
+from simulator import EntropyStrategy, play_game  # noqa: E402
+from word_list import load_word_lists  # noqa: E402
+from word_painter import get_painted_words  # noqa: E402
+
+BASELINE_FILE = PACKAGE_DIR / "benchmarks" / "baseline.json"
+THRESHOLD = 25.0
+SEED = 1234
+REPEATS = 5
+
+Case = Tuple[Callable[[], object], int]
+
+
+def word_list_load() -> Case:
+    def load() -> None:
+        load_word_lists.cache_clear()
+        load_word_lists()
+    return load, 20
+
+
+def input_validation() -> Case:
+    rng = random.Random(SEED)
+    words = [rng.choice(GUESSES) for _ in range(5000)] + [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(5))
+        for _ in range(5000)
+        ]
+
+    def validate() -> None:
+        for word in words:
+            is_input_valid(word)
+    return validate, 1
+
+
+def painting(game_type: GameType) -> Callable[[], Case]:
+    def case() -> Case:
+        rng = random.Random(SEED)
+        number_of_words = game_type.get_number_of_words()
+        calls = [
+            (rng.choice(GUESSES), rng.sample(WORDS, number_of_words))
+            for _ in range(1000)
+            ]
+        were_words_guessed = [False] * number_of_words
+
+        def paint() -> None:
+            for word_input, correct_words in calls:
+                get_painted_words(word_input, correct_words,
+                                  were_words_guessed)
+        return paint, 1
+    return case
+
+
+def simulated_games(game_type: GameType, games: int) -> Callable[[], Case]:
+    def case() -> Case:
+        rng = random.Random(SEED)
+        number_of_words = game_type.get_number_of_words()
+        boards = [rng.sample(WORDS, number_of_words) for _ in range(games)]
+        strategy = EntropyStrategy()
+
+        def play() -> None:
+            for correct_words in boards:
+                play_game(game_type, strategy, correct_words)
+        return play, 1
+    return case
+
+
+def label_grid(game_type: GameType) -> Callable[[], Case]:
+    def case() -> Case:
+        from tkinter import Frame, Tk
+
+        from main_gui import generate_labels
+
+        root = Tk()
+
+        def build() -> None:
+            frame = Frame(root)
+            generate_labels(frame, game_type)
+            frame.destroy()
+            root.update()
+        return build, 10
+    return case
+
+
+CASES: Dict[str, Callable[[], Case]] = {
+    "word_list_load": word_list_load,
+    "is_input_valid_10k": input_validation,
+    "painted_words_wordle_1k": painting(Wordle()),
+    "painted_words_dordle_1k": painting(Dordle()),
+    "painted_words_quordle_1k": painting(Quordle()),
+    "simulate_wordle_50": simulated_games(Wordle(), 50),
+    "simulate_quordle_10": simulated_games(Quordle(), 10),
+}
+GUI_CASES: Dict[str, Callable[[], Case]] = {
+    "generate_labels_wordle": label_grid(Wordle()),
+    "generate_labels_quordle": label_grid(Quordle()),
+}
+
+
+def measure(make_case: Callable[[], Case], repeats: int) -> float:
+    run, number = make_case()
+    run()
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_cases(cases: Dict[str, Callable[[], Case]],
+              repeats: int) -> Dict[str, float]:
+    return {name: measure(make_case, repeats)
+            for name, make_case in cases.items()}
+
+
+def run_gui_cases(repeats: int,
+                  selected: Optional[List[str]]) -> Dict[str, float]:
+    cases = {name: case for name, case in GUI_CASES.items()
+             if selected is None or name in selected}
+    if not cases:
+        return {}
+    if os.environ.get("DISPLAY"):
+        return run_cases(cases, repeats)
+
+    xvfb_run = shutil.which("xvfb-run")
+    if xvfb_run is None:
+        print("no display and no xvfb-run, skipping GUI cases",
+              file=sys.stderr)
+        return {}
+    output = subprocess.run(
+        [xvfb_run, "-a", sys.executable, __file__, "--gui-only",
+         "--repeats", str(repeats), "--cases", *cases],
+        check=True, capture_output=True, text=True
+        ).stdout
+    return json.loads(output)
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[str]:
+    regressions: List[str] = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        change = ""
+        if reference:
+            percent = (seconds / reference - 1) * 100
+            change = f"{percent:+7.1f}%"
+            if percent > threshold:
+                regressions.append(name)
+                change += "  REGRESSION"
+        print(f"{name:28} {seconds * 1e3:10.3f} ms {change}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the benchmark suite against a stored baseline."
+        )
+    parser.add_argument("--cases", nargs="*", default=None,
+                        choices=list(CASES) + list(GUI_CASES))
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown in percent")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--gui-only", action="store_true",
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.gui_only:
+        print(json.dumps(run_cases(
+            {name: GUI_CASES[name] for name in args.cases}, args.repeats
+            )))
+        return
+
+    results = run_cases(
+        {name: case for name, case in CASES.items()
+         if args.cases is None or name in args.cases},
+        args.repeats
+        )
+    results.update(run_gui_cases(args.repeats, args.cases))
+
+    baseline: Dict[str, float] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=1,
+                                            sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} case(s) slower than the baseline by more"
+              f" than {args.threshold:g}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from tkinter import Canvas, Frame, Label, Scrollbar
+from typing import List, Tuple
+
+from game_type import MAX_GRID_HEIGHT, GameType, grid_layout
+from metrics import timed
+from scoring import SOLVED_PATTERN, get_patterns
+from word_painter_gui import (TK_TEMPLATES, put_painted_words_in_gui,
+                              reset_labels)
+
+GRID_COLOR = "#d0d0d0"
+LETTER_TAG = "letter"
+
+
+class BoardView(ABC):
+
+    @abstractmethod
+    def paint_row(self, guess_number: int, word_input: str,
+                  correct_words: List[str],
+                  were_words_guessed: List[bool]) -> None:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class LabelBoardView(BoardView):
+
+    def __init__(self, labels: List[List[List[Label]]]) -> None:
+        self.labels = labels
+        self.empty_color = labels[0][0][0].cget("fg")
+        self.empty_font = labels[0][0][0].cget("font")
+
+    @timed("paint_row")
+    def paint_row(self, guess_number: int, word_input: str,
+                  correct_words: List[str],
+                  were_words_guessed: List[bool]) -> None:
+        put_painted_words_in_gui(word_input, correct_words,
+                                 were_words_guessed, guess_number,
+                                 self.labels[guess_number])
+
+    @timed("reset_board")
+    def reset(self) -> None:
+        reset_labels(self.labels, self.empty_color, self.empty_font)
+
+
+class CanvasBoardView(BoardView):
+
+    def __init__(self, master: Frame, game_type: GameType) -> None:
+        self.number_of_words = game_type.get_number_of_words()
+        self.max_guesses = game_type.get_max_guesses()
+        self.cell, self.boards_per_row = grid_layout(self.number_of_words)
+        self.font = f"Helvetica {self.cell * 2 // 3} bold"
+
+        rows_of_boards = -(-self.number_of_words // self.boards_per_row)
+        self.band_height = (self.max_guesses + 1) * self.cell
+        width = self.boards_per_row * 6 * self.cell
+        height = rows_of_boards * self.band_height
+        self.canvas = Canvas(master, width=width,
+                             height=min(height, MAX_GRID_HEIGHT),
+                             scrollregion=(0, 0, width, height),
+                             highlightthickness=0)
+        if height > MAX_GRID_HEIGHT:
+            scrollbar = Scrollbar(master, command=self.canvas.yview)
+            self.canvas.config(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left")
+        self._draw_grid()
+
+    def _origin(self, board: int) -> Tuple[int, int]:
+        band, column = divmod(board, self.boards_per_row)
+        return column * 6 * self.cell, band * self.band_height
+
+    def _draw_grid(self) -> None:
+        for board in range(self.number_of_words):
+            x, y = self._origin(board)
+            bottom = y + self.max_guesses * self.cell
+            right = x + 5 * self.cell
+            for row in range(self.max_guesses + 1):
+                top = y + row * self.cell
+                self.canvas.create_line(x, top, right, top, fill=GRID_COLOR)
+            for column in range(6):
+                left = x + column * self.cell
+                self.canvas.create_line(left, y, left, bottom,
+                                        fill=GRID_COLOR)
+
+    @timed("paint_row")
+    def paint_row(self, guess_number: int, word_input: str,
+                  correct_words: List[str],
+                  were_words_guessed: List[bool]) -> None:
+        patterns = get_patterns(word_input, correct_words)
+        commands: List[str] = []
+        for board, pattern in enumerate(patterns):
+            x, y = self._origin(board)
+            y += guess_number * self.cell + self.cell // 2
+            if were_words_guessed[board]:
+                cells = zip("*****", TK_TEMPLATES[SOLVED_PATTERN])
+            else:
+                cells = zip(word_input.upper(), TK_TEMPLATES[pattern])
+            for column, (letter, color) in enumerate(cells):
+                commands.append(
+                    f"{self.canvas} create text"
+                    f" {x + column * self.cell + self.cell // 2} {y}"
+                    f" -text {letter} -fill {{{color}}}"
+                    f" -font {{{self.font}}} -tags {LETTER_TAG}"
+                    )
+        self.canvas.tk.eval("\n".join(commands))
+
+    @timed("reset_board")
+    def reset(self) -> None:
+        self.canvas.delete(LETTER_TAG)
+        self.canvas.yview_moveto(0)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from game_type import WORDS
+from scoring import (ANSWER_INDEX, GUESS_INDEX, NUMBER_OF_PATTERNS,
+                     get_pattern_matrix)
+
+
+class BoardCandidates:
+
+    def __init__(self, correct_words: List[str]) -> None:
+        self._answers = np.array(
+            [ANSWER_INDEX[word] for word in correct_words], dtype=np.intp
+            )
+        self.masks = np.ones((len(correct_words), len(WORDS)), dtype=bool)
+        self.counts = np.full(len(correct_words), len(WORDS))
+        self._matches = np.empty(len(WORDS), dtype=bool)
+        self._matrix = np.asarray(get_pattern_matrix())
+
+    def narrow(self, word_input: str) -> np.ndarray:
+        row = self._matrix[GUESS_INDEX[word_input]]
+        patterns = row[self._answers]
+        for board, pattern in enumerate(patterns):
+            mask = self.masks[board]
+            np.equal(row, pattern, out=self._matches)
+            np.logical_and(mask, self._matches, out=mask)
+            self.counts[board] = np.count_nonzero(mask)
+        return patterns
+
+    def retarget(self, word_input: str) -> List[str]:
+        row = self._matrix[GUESS_INDEX[word_input]]
+        for board, mask in enumerate(self.masks):
+            indices = np.flatnonzero(mask)
+            patterns = row[indices]
+            largest = np.argmax(
+                np.bincount(patterns, minlength=NUMBER_OF_PATTERNS)
+                )
+            self._answers[board] = indices[np.argmax(patterns == largest)]
+        return [WORDS[index] for index in self._answers]
+
+    def get_counts(self) -> List[int]:
+        return self.counts.tolist()
+
+    def get_indices(self, board: int) -> np.ndarray:
+        return np.flatnonzero(self.masks[board])
+
+    def get_words(self, board: int) -> List[str]:
+        return [WORDS[index] for index in self.get_indices(board)]
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from game_type import GUESSES, WORDS
+from guessing_process import GuessingObserver, GuessingProcess
+from scoring import (CACHE_DIR, SOLVED_PATTERN, get_pattern,
+                     get_pattern_matrix, words_digest)
+from solver import all_candidates, entropies, legal_guess_mask, suggest
+
+ROOT_WIDTH = 8
+WIDTH = 4
+CANDIDATE_WIDTH = 2
+
+FlatTree = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def get_decision_tree_file() -> Path:
+    return CACHE_DIR / f"tree-{words_digest(GUESSES, WORDS)[:16]}.npz"
+
+
+def _lower_bound(size: int) -> int:
+    return 2 * size - 1
+
+
+def split_by_pattern(row: np.ndarray,
+                     candidates: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+    patterns = row[candidates]
+    order = np.argsort(patterns, kind="stable")
+    patterns = patterns[order]
+    boundaries = np.flatnonzero(np.diff(patterns)) + 1
+    return [
+        (int(patterns[start]), candidates[order[start:end]])
+        for start, end in zip(np.r_[0, boundaries],
+                              np.r_[boundaries, len(patterns)])
+        ]
+
+
+class TreeSearch:
+
+    def __init__(self, width: int = WIDTH,
+                 candidate_width: int = CANDIDATE_WIDTH) -> None:
+        self.width = width
+        self.candidate_width = candidate_width
+        self.matrix = np.asarray(get_pattern_matrix())
+        self.memo: Dict[bytes, Tuple[int, int]] = {}
+
+    def options(self, candidates: np.ndarray, width: int) -> List[int]:
+        information = entropies(candidates)
+        ranked = np.argsort(-information, kind="stable")[:width].tolist()
+        candidate_ranked = candidates[
+            np.argsort(-information[candidates], kind="stable")
+            ][:self.candidate_width].tolist()
+        return ranked + [guess for guess in candidate_ranked
+                         if guess not in ranked]
+
+    def best(self, candidates: np.ndarray) -> Tuple[int, int]:
+        if len(candidates) <= 2:
+            return _lower_bound(len(candidates)), int(candidates[0])
+        key = candidates.tobytes()
+        if key not in self.memo:
+            self.memo[key] = self.evaluate(
+                candidates, self.options(candidates, self.width)
+                )
+        return self.memo[key]
+
+    def evaluate(self, candidates: np.ndarray,
+                 options: List[int]) -> Tuple[int, int]:
+        best_cost, best_guess = np.iinfo(np.int64).max, -1
+        for guess in options:
+            cost = self.cost_with(candidates, guess, best_cost)
+            if cost is not None and cost < best_cost:
+                best_cost, best_guess = cost, guess
+        return best_cost, best_guess
+
+    def cost_with(self, candidates: np.ndarray, guess: int,
+                  bound: int) -> Optional[int]:
+        buckets = [
+            bucket for pattern, bucket
+            in split_by_pattern(self.matrix[guess], candidates)
+            if pattern != SOLVED_PATTERN
+            ]
+        if len(buckets) == 1 and len(buckets[0]) == len(candidates):
+            return None
+        cost = len(candidates) + sum(_lower_bound(len(bucket))
+                                     for bucket in buckets)
+        if cost >= bound:
+            return None
+        for bucket in sorted(buckets, key=len, reverse=True):
+            cost += self.best(bucket)[0] - _lower_bound(len(bucket))
+            if cost >= bound:
+                return None
+        return cost
+
+    def flatten(self, candidates: np.ndarray, guess: int) -> FlatTree:
+        node_guesses: List[int] = []
+        children: List[List[Tuple[int, int]]] = []
+
+        def add_node(candidates: np.ndarray, guess: int) -> int:
+            node = len(node_guesses)
+            node_guesses.append(guess)
+            children.append([])
+            for pattern, bucket in split_by_pattern(self.matrix[guess],
+                                                    candidates):
+                if pattern == SOLVED_PATTERN:
+                    continue
+                child = add_node(bucket, self.best(bucket)[1])
+                children[node].append((pattern, child))
+            return node
+
+        add_node(candidates, guess)
+        child_start = np.zeros(len(node_guesses) + 1, dtype=np.int32)
+        child_start[1:] = np.cumsum([len(edges) for edges in children])
+        edges = [edge for node_edges in children for edge in node_edges]
+        return (
+            np.array(node_guesses, dtype=np.int32),
+            child_start,
+            np.array([pattern for pattern, child in edges], dtype=np.uint8),
+            np.array([child for pattern, child in edges], dtype=np.int32),
+            )
+
+
+def _search_root(guess: int, width: int,
+                 candidate_width: int) -> Tuple[Optional[int], FlatTree]:
+    search = TreeSearch(width, candidate_width)
+    candidates = all_candidates()
+    cost = search.cost_with(candidates, guess, np.iinfo(np.int64).max)
+    return cost, search.flatten(candidates, guess)
+
+
+def build_decision_tree(root_width: int = ROOT_WIDTH, width: int = WIDTH,
+                        candidate_width: int = CANDIDATE_WIDTH,
+                        workers: Optional[int] = None) -> Tuple[int, str]:
+    options = TreeSearch(width, candidate_width).options(all_candidates(),
+                                                         root_width)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            _search_root, options, [width] * len(options),
+            [candidate_width] * len(options)
+            ))
+
+    cost, tree = min(
+        (result for result in results if result[0] is not None),
+        key=lambda result: result[0]
+        )
+    path = get_decision_tree_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, node_guesses=tree[0], child_start=tree[1],
+             child_patterns=tree[2], child_nodes=tree[3])
+    return cost, GUESSES[tree[0][0]]  # type: ignore
+
+
+class DecisionTree:
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        with np.load(path or get_decision_tree_file()) as arrays:
+            self.node_guesses = arrays["node_guesses"]
+            self.child_start = arrays["child_start"]
+            self.child_patterns = arrays["child_patterns"]
+            self.child_nodes = arrays["child_nodes"]
+
+    def get_guess(self, node: int) -> str:
+        return GUESSES[self.node_guesses[node]]
+
+    def get_child(self, node: int, pattern: int) -> Optional[int]:
+        start, end = self.child_start[node], self.child_start[node + 1]
+        position = start + np.searchsorted(self.child_patterns[start:end],
+                                           pattern)
+        if position < end and self.child_patterns[position] == pattern:
+            return int(self.child_nodes[position])
+        return None
+
+
+class TreeSolver(GuessingObserver):
+
+    def __init__(self, guessing_process: GuessingProcess,
+                 tree: DecisionTree) -> None:
+        self.tree = tree
+        self.node: Optional[int] = 0
+        self.fallback: Optional[str] = None
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        if self.node is not None:
+            word_input = guessing_process.get_guesses()[-1]
+            correct_word = guessing_process.get_correct_words()[0]
+            if word_input == self.tree.get_guess(self.node):
+                self.node = self.tree.get_child(
+                    self.node, get_pattern(word_input, correct_word)
+                    )
+            else:
+                self.node = None
+        hard_mode = guessing_process.get_hard_mode()
+        if self.node is not None and (
+                hard_mode is None
+                or hard_mode.allows(self.tree.get_guess(self.node))):
+            return
+        self.node = None
+
+        suggestions: List[Tuple[str, float]] = []
+        if not all(guessing_process.get_were_words_guessed()):
+            suggestions = suggest(
+                guessing_process.get_candidates().get_indices(0), 1,
+                legal_guess_mask(guessing_process)
+                )
+        self.fallback = suggestions[0][0] if suggestions else None
+
+    def get_best_guess(self) -> Optional[str]:
+        if self.node is None:
+            return self.fallback
+        return self.tree.get_guess(self.node)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the Wordle decision tree."
+        )
+    parser.add_argument("--root-width", type=int, default=ROOT_WIDTH)
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--candidate-width", type=int,
+                        default=CANDIDATE_WIDTH)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cost, opener = build_decision_tree(args.root_width, args.width,
+                                       args.candidate_width, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"opener: {opener}")
+    print(f"expected guesses: {cost / len(WORDS):.4f}"
+          f" ({cost} over {len(WORDS)} answers)")
+    print(f"build time: {elapsed:.1f} s")
+    print(f"written to {get_decision_tree_file()}")
+
+
+if __name__ == "__main__":
+    main()
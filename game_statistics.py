@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from game_type import GAME_TYPE_OPTIONS, GUESSES, WORDS
+from guessing_process import GuessingObserver, GuessingProcess
+from scoring import ANSWER_INDEX, GUESS_INDEX
+
+HISTOGRAM_SIZE = 64
+SNAPSHOT_INTERVAL = 10.0
+
+ARRAY_NAMES = ("wins", "losses", "word_games", "word_solved",
+               "word_guesses", "guess_usage")
+
+
+class GameStatistics:
+
+    def __init__(self) -> None:
+        self.game_types = list(GAME_TYPE_OPTIONS)
+        self.wins = np.zeros((len(self.game_types), HISTOGRAM_SIZE),
+                             dtype=np.int64)
+        self.losses = np.zeros(len(self.game_types), dtype=np.int64)
+        self.word_games = np.zeros(len(WORDS), dtype=np.int64)
+        self.word_solved = np.zeros(len(WORDS), dtype=np.int64)
+        self.word_guesses = np.zeros(len(WORDS), dtype=np.int64)
+        self.guess_usage = np.zeros(len(GUESSES), dtype=np.int64)
+
+    def record_game(self, game_type_name: str, won: bool,
+                    number_of_guesses: int) -> None:
+        game_type = self.game_types.index(game_type_name)
+        if won:
+            self.wins[game_type, min(number_of_guesses,
+                                     HISTOGRAM_SIZE - 1)] += 1
+        else:
+            self.losses[game_type] += 1
+
+    def record_board(self, word: str, solved_at: Optional[int]) -> None:
+        index = ANSWER_INDEX[word]
+        self.word_games[index] += 1
+        if solved_at is not None:
+            self.word_solved[index] += 1
+            self.word_guesses[index] += solved_at
+
+    def record_guess(self, word: str) -> None:
+        self.guess_usage[GUESS_INDEX[word]] += 1
+
+    def merge(self, other: GameStatistics) -> GameStatistics:
+        for name in ARRAY_NAMES:
+            counters = getattr(self, name)
+            np.add(counters, getattr(other, name), out=counters)
+        return self
+
+    def summary(self, game_type_name: str) -> Dict[str, object]:
+        game_type = self.game_types.index(game_type_name)
+        wins = self.wins[game_type]
+        won = int(wins.sum())
+        losses = int(self.losses[game_type])
+        games = won + losses
+        return {
+            "game_type": game_type_name,
+            "games": games,
+            "win_rate": won / games if games else float("nan"),
+            "mean_guesses": (float(wins @ np.arange(HISTOGRAM_SIZE)) / won
+                             if won else float("nan")),
+            "distribution": {
+                guesses: int(wins[guesses])
+                for guesses in np.flatnonzero(wins).tolist()
+                },
+            "losses": losses,
+        }
+
+    def hardest_words(self, top: int = 10) -> List[Tuple[str, float, float]]:
+        played = np.flatnonzero(self.word_games)
+        solve_rate = self.word_solved[played] / self.word_games[played]
+        mean_guesses = (self.word_guesses[played]
+                        / np.maximum(self.word_solved[played], 1))
+        ranked = played[np.lexsort((-mean_guesses, solve_rate))][:top]
+        return [
+            (WORDS[index],
+             float(self.word_solved[index] / self.word_games[index]),
+             float(self.word_guesses[index]
+                   / max(self.word_solved[index], 1)))
+            for index in ranked
+            ]
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial_file = path.with_suffix(".partial.npz")
+        np.savez(partial_file, game_types=np.array(self.game_types),
+                 **{name: getattr(self, name) for name in ARRAY_NAMES})
+        partial_file.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> GameStatistics:
+        statistics = cls()
+        with np.load(path) as arrays:
+            if arrays["game_types"].tolist() != statistics.game_types:
+                raise ValueError(f"{path} was written for other game types")
+            for name in ARRAY_NAMES:
+                getattr(statistics, name)[...] = arrays[name]
+        return statistics
+
+
+class StatisticsCollector(GuessingObserver):
+
+    def __init__(self, statistics: GameStatistics, game_type_name: str,
+                 guessing_process: GuessingProcess) -> None:
+        self.statistics = statistics
+        self.game_type_name = game_type_name
+        self.solved_at: List[Optional[int]] = [
+            None for word in guessing_process.get_correct_words()
+            ]
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        number_of_guesses = guessing_process.get_number_of_guesses()
+        self.statistics.record_guess(guessing_process.get_guesses()[-1])
+        were_words_guessed = guessing_process.get_were_words_guessed()
+        for index, was_word_guessed in enumerate(were_words_guessed):
+            if was_word_guessed and self.solved_at[index] is None:
+                self.solved_at[index] = number_of_guesses
+
+        won = all(were_words_guessed)
+        if won or number_of_guesses >= guessing_process.get_max_guesses():
+            self.statistics.record_game(self.game_type_name, won,
+                                        number_of_guesses)
+            for word, solved_at in zip(guessing_process.get_correct_words(),
+                                       self.solved_at):
+                self.statistics.record_board(word, solved_at)
+
+
+class SnapshotWriter:
+
+    def __init__(self, statistics: GameStatistics, path: Path,
+                 interval: float = SNAPSHOT_INTERVAL) -> None:
+        self.statistics = statistics
+        self.path = path
+        self.interval = interval
+        self.last_flush = time.monotonic()
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self.last_flush >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        self.statistics.save(self.path)
+        self.last_flush = time.monotonic()
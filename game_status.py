@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from guessing_process import GuessingObserver, GuessingProcess
+
+
+class GameStatus(GuessingObserver):
+
+    def __init__(self, guessing_process: GuessingProcess) -> None:
+        self.game_is_running = True
+        self.guessing_process = guessing_process
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        if (guessing_process.get_number_of_guesses()
+                >= guessing_process.get_max_guesses()
+                and not all(guessing_process.get_were_words_guessed())):
+            self.game_is_running = False
+            self.game_won = False
+        elif all(guessing_process.get_were_words_guessed()):
+            self.game_is_running = False
+            self.game_won = True
+
+    def trigger_end_game(self) -> None:
+        if self.game_won:
+            print("Congratulations! You guessed it right!\n")
+        else:
+            print("I'm sorry! You lost. : (")
+            print("The correct answer was"
+                  f" {str(self.guessing_process.get_correct_words())}.\n")
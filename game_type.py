@@ -1,20 +1,62 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from random import randint
-from typing import List
+from functools import lru_cache
+from random import Random
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-WORDS: List[str] = []
-with open("wordle-answers-alphabetical.txt") as file:
-    WORDS = file.read().split("\n")
+from metrics import timed
+from word_index import WordIndex
+from word_list import get_answers, get_guesses
 
+if TYPE_CHECKING:
+    from hard_mode import HardMode
 
-def is_input_valid(word_input: str) -> bool:
-    return word_input in WORDS
+MAX_GRID_HEIGHT = 700
+
+_LAZY_ATTRIBUTES = {
+    "WORDS": get_answers,
+    "GUESSES": get_guesses,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    if name == "WORD_INDEX":
+        return get_word_index()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def get_word_index() -> WordIndex:
+    return WordIndex(get_guesses())
+
+
+@timed("is_input_valid")
+def is_input_valid(word_input: str,
+                   hard_mode: Optional[HardMode] = None) -> bool:
+    return (word_input in get_word_index()
+            and (hard_mode is None or hard_mode.allows(word_input)))
 
 
 class GameType(ABC):
 
+    def __init__(self, hard_mode: bool = False,
+                 seed: Optional[int] = None) -> None:
+        self.hard_mode = hard_mode
+        self.seed = seed
+        self.rng = Random(seed)
+
+    def is_hard_mode(self) -> bool:
+        return self.hard_mode
+
+    def is_adversarial(self) -> bool:
+        return False
+
+    def get_seed(self) -> Optional[int]:
+        return self.seed
+
     @abstractmethod
     def get_max_guesses(self) -> int:
         pass
@@ -39,7 +81,7 @@ class Wordle(GameType):
 
     def generate_correct_words(self) -> List[str]:
         correct_words = [
-            WORDS[randint(0, len(WORDS))]
+            get_answers()[self.rng.randrange(len(get_answers()))]
             ]
         return correct_words
 
@@ -57,7 +99,7 @@ class Dordle(GameType):
 
     def generate_correct_words(self) -> List[str]:
         correct_words = [
-            WORDS[randint(0, len(WORDS))]
+            get_answers()[self.rng.randrange(len(get_answers()))]
             for i in range(0, 2)
             ]
         return correct_words
@@ -76,7 +118,7 @@ class Quordle(GameType):
 
     def generate_correct_words(self) -> List[str]:
         correct_words = [
-            WORDS[randint(0, len(WORDS))]
+            get_answers()[self.rng.randrange(len(get_answers()))]
             for i in range(0, 4)
             ]
         return correct_words
@@ -86,3 +128,80 @@ class Quordle(GameType):
 
     def get_geometry(self) -> str:
         return '600x400'
+
+
+class Absurdle(GameType):
+
+    def get_max_guesses(self) -> int:
+        return 12
+
+    def generate_correct_words(self) -> List[str]:
+        return [get_answers()[self.rng.randrange(len(get_answers()))]]
+
+    def get_number_of_words(self) -> int:
+        return 1
+
+    def get_geometry(self) -> str:
+        return '250x600'
+
+    def is_adversarial(self) -> bool:
+        return True
+
+
+class NBoardGame(GameType):
+
+    def __init__(self, number_of_words: int = 8, hard_mode: bool = False,
+                 seed: Optional[int] = None) -> None:
+        super().__init__(hard_mode, seed)
+        self.number_of_words = number_of_words
+
+    def get_max_guesses(self) -> int:
+        return self.number_of_words + 5
+
+    def generate_correct_words(self) -> List[str]:
+        correct_words = [
+            get_answers()[self.rng.randrange(len(get_answers()))]
+            for i in range(0, self.number_of_words)
+            ]
+        return correct_words
+
+    def get_number_of_words(self) -> int:
+        return self.number_of_words
+
+    def get_geometry(self) -> str:
+        cell, boards_per_row = grid_layout(self.number_of_words)
+        rows_of_boards = -(-self.number_of_words // boards_per_row)
+        width = boards_per_row * 6 * cell + 2 * cell
+        height = min(rows_of_boards * (self.get_max_guesses() + 1) * cell,
+                     MAX_GRID_HEIGHT) + 150
+        return f'{width}x{height}'
+
+
+class Octordle(NBoardGame):
+
+    def __init__(self, hard_mode: bool = False,
+                 seed: Optional[int] = None) -> None:
+        super().__init__(8, hard_mode, seed)
+
+
+class Duotrigordle(NBoardGame):
+
+    def __init__(self, hard_mode: bool = False,
+                 seed: Optional[int] = None) -> None:
+        super().__init__(32, hard_mode, seed)
+
+
+def grid_layout(number_of_words: int) -> Tuple[int, int]:
+    if number_of_words <= 8:
+        return 22, number_of_words
+    return 12, 16
+
+
+GAME_TYPE_OPTIONS = {
+    "wordle": Wordle,
+    "dordle": Dordle,
+    "quordle": Quordle,
+    "octordle": Octordle,
+    "duotrigordle": Duotrigordle,
+    "absurdle": Absurdle
+}
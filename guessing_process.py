@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from tkinter import END, Entry, Event, Label, Tk
-from typing import List
+from typing import List, Optional
 
+from candidates import BoardCandidates
 from game_type import GameType, is_input_valid
-from word_painter import get_painted_words, put_painted_words_in_gui
+from hard_mode import HardMode
+from metrics import REGISTRY, timed
+from word_painter import get_painted_words
 
 
 class GuessingObserver(ABC):
@@ -45,51 +47,74 @@ class GuessingProcess(ABC):
     def get_correct_words(self) -> List[str]:
         pass
 
+    @abstractmethod
+    def get_guesses(self) -> List[str]:
+        pass
 
-class GuessingProcessNoGui(GuessingProcess):
+    @abstractmethod
+    def get_candidates(self) -> BoardCandidates:
+        pass
 
-    def __init__(self, game_type: GameType) -> None:
+    @abstractmethod
+    def get_remaining_candidates(self) -> List[int]:
+        pass
+
+    @abstractmethod
+    def get_hard_mode(self) -> Optional[HardMode]:
+        pass
+
+
+class GuessingProcessBase(GuessingProcess):
+
+    def __init__(self, game_type: GameType,
+                 correct_words: Optional[List[str]] = None) -> None:
         self.game_type = game_type
 
-        self.correct_words = game_type.generate_correct_words()
+        if correct_words is None:
+            correct_words = game_type.generate_correct_words()
+        self.correct_words = correct_words
         self.were_words_guessed: List[bool] = [
             False for word in self.correct_words
             ]
         self.max_guesses = game_type.get_max_guesses()
         self.number_of_guesses: int = 0
+        self.guesses: List[str] = []
+        self.candidates = BoardCandidates(self.correct_words)
+        self.hard_mode: Optional[HardMode] = None
+        if game_type.is_hard_mode():
+            self.hard_mode = HardMode(len(self.correct_words))
         self._observers: List[GuessingObserver] = []
 
     def attach(self, observer: GuessingObserver) -> None:
         self._observers.append(observer)
 
+    @timed("notify")
     def _notify(self) -> None:
         for observer in self._observers:
             observer.update(self)
 
-    def guess_step(self) -> None:
-        word_is_valid = False
-        while not word_is_valid:
-            word_input = input("Write your next attempt!\n")
-            word_input = word_input.lower()
+    def respond(self, word_input: str) -> None:
+        if self.game_type.is_adversarial():
+            self.correct_words = self.candidates.retarget(word_input)
 
-            if is_input_valid(word_input):
-                word_is_valid = True
-            else:
-                print("Invalid word. Please select another one.\n")
-
-        painted_words = get_painted_words(
-            word_input,  # type: ignore
-            self.correct_words,
-            self.were_words_guessed
-            )
-        print(painted_words)
+    @timed("make_guess")
+    def make_guess(self, word_input: str) -> List[int]:
+        self.respond(word_input)
+        return self._record_guess(word_input)
 
+    def _record_guess(self, word_input: str) -> List[int]:
         for index, word in enumerate(self.correct_words):
-            if word_input == word:  # type: ignore
+            if word_input == word:
                 self.were_words_guessed[index] = True
 
+        patterns = self.candidates.narrow(word_input)
+        if self.hard_mode is not None:
+            self.hard_mode.add_feedback(word_input, patterns,
+                                        self.were_words_guessed)
+        self.guesses.append(word_input)
         self.number_of_guesses += 1
         self._notify()
+        return patterns.tolist()
 
     def get_max_guesses(self) -> int:
         return self.max_guesses
@@ -103,62 +128,39 @@ class GuessingProcessNoGui(GuessingProcess):
     def get_correct_words(self) -> List[str]:
         return self.correct_words
 
+    def get_guesses(self) -> List[str]:
+        return self.guesses
 
-class GuessingProcessGui(GuessingProcess):
-
-    def __init__(self, game_type: GameType, root: Tk,
-                 labels: List[List[List[Label]]],
-                 end_print: Label) -> None:
-        self.game_type = game_type
-
-        self.correct_words = game_type.generate_correct_words()
-        self.were_words_guessed: List[bool] = [
-            False for word in self.correct_words
-            ]
-        self.max_guesses = game_type.get_max_guesses()
-        self.number_of_guesses: int = 0
-        self._observers: List[GuessingObserver] = []
-
-        self.root = root
-        self.labels = labels
-        self.end_print = end_print
-
-    def attach(self, observer: GuessingObserver) -> None:
-        self._observers.append(observer)
+    def get_candidates(self) -> BoardCandidates:
+        return self.candidates
 
-    def _notify(self) -> None:
-        for observer in self._observers:
-            observer.update(self)
-
-    def guess_step(self, event: Event) -> None:
-        entry: Entry = event.widget
-        word_input = entry.get().lower()
-        entry.delete(0, END)
+    def get_remaining_candidates(self) -> List[int]:
+        return self.candidates.get_counts()
 
-        if is_input_valid(word_input):
-            self.end_print.config(text="")
-            put_painted_words_in_gui(word_input, self.correct_words,
-                                     self.were_words_guessed,
-                                     self.number_of_guesses,
-                                     self.labels[self.number_of_guesses])
+    def get_hard_mode(self) -> Optional[HardMode]:
+        return self.hard_mode
 
-            for index, word in enumerate(self.correct_words):
-                if word_input == word:  # type: ignore
-                    self.were_words_guessed[index] = True
 
-            self.number_of_guesses += 1
-            self._notify()
-        else:
-            self.end_print.config(text="Invalid word.")
+class GuessingProcessNoGui(GuessingProcessBase):
 
-    def get_max_guesses(self) -> int:
-        return self.max_guesses
+    def guess_step(self) -> None:
+        word_is_valid = False
+        while not word_is_valid:
+            word_input = input("Write your next attempt!\n")
+            word_input = word_input.lower()
 
-    def get_were_words_guessed(self) -> List[bool]:
-        return self.were_words_guessed
+            if is_input_valid(word_input, self.hard_mode):
+                word_is_valid = True
+            else:
+                REGISTRY.increment("invalid_words")
+                print("Invalid word. Please select another one.\n")
 
-    def get_number_of_guesses(self) -> int:
-        return self.number_of_guesses
+        self.respond(word_input)  # type: ignore
+        painted_words = get_painted_words(
+            word_input,  # type: ignore
+            self.correct_words,
+            self.were_words_guessed
+            )
+        print(painted_words)
 
-    def get_correct_words(self) -> List[str]:
-        return self.correct_words
+        self._record_guess(word_input)  # type: ignore
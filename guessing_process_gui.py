@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from tkinter import END, Entry, Event, Label, Tk
+
+from board_view import BoardView
+from game_type import GameType, is_input_valid
+from guessing_process import GuessingProcessBase
+from metrics import REGISTRY, timed
+
+
+class GuessingProcessGui(GuessingProcessBase):
+
+    def __init__(self, game_type: GameType, root: Tk,
+                 board_view: BoardView,
+                 end_print: Label) -> None:
+        super().__init__(game_type)
+        self.root = root
+        self.board_view = board_view
+        self.end_print = end_print
+
+    @timed("gui_guess_step")
+    def guess_step(self, event: Event) -> None:
+        entry: Entry = event.widget
+        word_input = entry.get().lower()
+        entry.delete(0, END)
+
+        if is_input_valid(word_input, self.hard_mode):
+            self.end_print.config(text="")
+            self.respond(word_input)
+            self.board_view.paint_row(self.number_of_guesses, word_input,
+                                      self.correct_words,
+                                      self.were_words_guessed)
+            self._record_guess(word_input)
+        else:
+            REGISTRY.increment("invalid_words")
+            self.end_print.config(text="Invalid word.")
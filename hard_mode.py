@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from game_type import GUESSES
+from scoring import GRAY, GREEN, decode_pattern
+from word_arrays import ALPHABET_SIZE, GUESS_ARRAYS, WORD_LENGTH
+
+ALL_LETTERS = (1 << ALPHABET_SIZE) - 1
+COUNT_BITS = 4
+COUNT_GUARDS = sum(1 << (COUNT_BITS * letter + COUNT_BITS - 1)
+                   for letter in range(ALPHABET_SIZE))
+
+
+def pack_counts(counts: Sequence[int]) -> int:
+    packed = 0
+    for letter, count in enumerate(counts):
+        packed |= count << (COUNT_BITS * letter)
+    return packed
+
+
+@lru_cache(maxsize=None)
+def word_bits(word: str) -> Tuple[int, int]:
+    positions = 0
+    counts = 0
+    for position, letter in enumerate(word):
+        code = ord(letter) - ord("a")
+        positions |= 1 << (ALPHABET_SIZE * position + code)
+        counts += 1 << (COUNT_BITS * code)
+    return positions, counts
+
+
+class LetterConstraints:
+
+    def __init__(self) -> None:
+        self.allowed: List[int] = [ALL_LETTERS] * WORD_LENGTH
+        self.minimum: List[int] = [0] * ALPHABET_SIZE
+        self.maximum: List[int] = [WORD_LENGTH] * ALPHABET_SIZE
+        self._forbidden = 0
+        self._minimum = 0
+        self._maximum = pack_counts(self.maximum) | COUNT_GUARDS
+
+    def add_feedback(self, word_input: str, pattern: int) -> None:
+        seen: Dict[int, int] = {}
+        grays: List[int] = []
+        for position, (letter, color) in enumerate(
+                zip(word_input, decode_pattern(pattern))):
+            code = ord(letter) - ord("a")
+            if color == GREEN:
+                self.allowed[position] &= 1 << code
+            else:
+                self.allowed[position] &= ~(1 << code)
+            if color == GRAY:
+                grays.append(code)
+            else:
+                seen[code] = seen.get(code, 0) + 1
+        for code, count in seen.items():
+            self.minimum[code] = max(self.minimum[code], count)
+        for code in grays:
+            self.maximum[code] = min(self.maximum[code], seen.get(code, 0))
+
+        self._forbidden = 0
+        for position, allowed in enumerate(self.allowed):
+            self._forbidden |= ((ALL_LETTERS & ~allowed)
+                                << (ALPHABET_SIZE * position))
+        self._minimum = pack_counts(self.minimum)
+        self._maximum = pack_counts(self.maximum) | COUNT_GUARDS
+
+    def allows(self, word: str) -> bool:
+        positions, counts = word_bits(word)
+        return (not positions & self._forbidden
+                and ((counts | COUNT_GUARDS) - self._minimum)
+                & COUNT_GUARDS == COUNT_GUARDS
+                and (self._maximum - counts)
+                & COUNT_GUARDS == COUNT_GUARDS)
+
+    def legal_mask(self) -> np.ndarray:
+        allowed = (
+            np.array(self.allowed, dtype=np.uint32)[:, None]
+            >> np.arange(ALPHABET_SIZE, dtype=np.uint32)
+            ) & 1
+        letters = GUESS_ARRAYS.letters
+        mask = np.ones(len(letters), dtype=bool)
+        for position in range(WORD_LENGTH):
+            mask &= allowed[position, letters[:, position]].astype(bool)
+        counts = GUESS_ARRAYS.letter_counts
+        mask &= (counts >= np.array(self.minimum, dtype=np.uint8)).all(axis=1)
+        mask &= (counts <= np.array(self.maximum, dtype=np.uint8)).all(axis=1)
+        return mask
+
+
+class HardMode:
+
+    def __init__(self, number_of_words: int) -> None:
+        self.boards = [LetterConstraints() for _ in range(number_of_words)]
+        self.open_boards = list(range(number_of_words))
+
+    def add_feedback(self, word_input: str, patterns: Sequence[int],
+                     were_words_guessed: Sequence[bool]) -> None:
+        for board, pattern in zip(self.boards, patterns):
+            board.add_feedback(word_input, pattern)
+        self.open_boards = [
+            index for index, was_word_guessed in enumerate(were_words_guessed)
+            if not was_word_guessed
+            ]
+
+    def allows(self, word: str) -> bool:
+        return any(self.boards[index].allows(word)
+                   for index in self.open_boards)
+
+    def legal_mask(self) -> np.ndarray:
+        mask = np.zeros(len(GUESSES), dtype=bool)
+        for index in self.open_boards:
+            mask |= self.boards[index].legal_mask()
+        return mask
+
+    def legal_guesses(self) -> List[str]:
+        return [GUESSES[index] for index in np.flatnonzero(self.legal_mask())]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from tkinter import Label, Misc
+from typing import Optional, Sequence
+
+import numpy as np
+
+from guessing_process import GuessingObserver, GuessingProcess
+from multi_board_solver import suggest_joint
+from solver import legal_guess_mask
+
+HINT_POLL_INTERVAL = 20
+HINT_WORKERS = 2
+
+
+def compute_hint(candidate_sets: Sequence[np.ndarray], objective: str,
+                 legal: Optional[np.ndarray] = None) -> Optional[str]:
+    suggestions = suggest_joint(candidate_sets, objective, 1, legal)
+    if suggestions:
+        return suggestions[0][0]
+    return None
+
+
+class HintService(GuessingObserver):
+
+    def __init__(self, root: Misc, hint: Label,
+                 objective: str = "information",
+                 executor: Optional[Executor] = None) -> None:
+        self.root = root
+        self.hint = hint
+        self.objective = objective
+        self.executor = executor or ProcessPoolExecutor(
+            max_workers=HINT_WORKERS
+            )
+        self.job: Optional[Future] = None
+        self._polling = False
+
+    def start(self, guessing_process: GuessingProcess) -> None:
+        guessing_process.attach(self)
+        self.update(guessing_process)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        self.cancel()
+        board_candidates = guessing_process.get_candidates()
+        candidate_sets = [
+            board_candidates.get_indices(index)
+            for index, was_word_guessed
+            in enumerate(guessing_process.get_were_words_guessed())
+            if not was_word_guessed
+            ]
+        if (not candidate_sets
+                or guessing_process.get_number_of_guesses()
+                >= guessing_process.get_max_guesses()):
+            self.hint.config(text="")
+            return
+
+        self.hint.config(text="Hint: ...")
+        self.job = self.executor.submit(compute_hint, candidate_sets,
+                                        self.objective,
+                                        legal_guess_mask(guessing_process))
+        if not self._polling:
+            self._polling = True
+            self.root.after(HINT_POLL_INTERVAL, self._poll)
+
+    def _poll(self) -> None:
+        job = self.job
+        if job is None:
+            self._polling = False
+            return
+        if not job.done():
+            self.root.after(HINT_POLL_INTERVAL, self._poll)
+            return
+
+        self._polling = False
+        self.job = None
+        best_guess = job.result()
+        self.hint.config(text=f"Hint: {best_guess}" if best_guess else "")
+
+    def cancel(self) -> None:
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+
+    def close(self) -> None:
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,51 +1,109 @@
 from __future__ import annotations
 
-from game_type import Dordle, Quordle, Wordle
+import argparse
+from pathlib import Path
+from typing import Union
+
+import metrics
+from decision_tree import DecisionTree, TreeSolver, get_decision_tree_file
+from game_status import GameStatus
+from game_type import GAME_TYPE_OPTIONS
 from guessing_process import (GuessingObserver, GuessingProcess,
                               GuessingProcessNoGui)
+from multi_board_solver import JointSolver
+from protocol import serve_protocol
+from solver import EntropySolver
+from transcript import TranscriptRecorder, append_transcripts
+
+HintSolver = Union[EntropySolver, JointSolver, TreeSolver]
+
 
-GAME_TYPE_OPTIONS = {
-    "wordle": Wordle,
-    "dordle": Dordle,
-    "quordle": Quordle
-}
+class RemainingWordsPrinter(GuessingObserver):
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        remaining = [
+            str(count) for count, was_word_guessed
+            in zip(guessing_process.get_remaining_candidates(),
+                   guessing_process.get_were_words_guessed())
+            if not was_word_guessed
+            ]
+        if remaining:
+            print(f"Words remaining: {' '.join(remaining)}")
 
 
-class GameStatus(GuessingObserver):
+class HintPrinter(GuessingObserver):
 
-    def __init__(self, guessing_process: GuessingProcess) -> None:
-        self.game_is_running = True
-        self.guessing_process = guessing_process
-        guessing_process.attach(self)
+    def __init__(self, solver: HintSolver) -> None:
+        self.solver = solver
 
     def update(self, guessing_process: GuessingProcess) -> None:
-        if (guessing_process.get_number_of_guesses()
-                >= guessing_process.get_max_guesses()
-                and not all(guessing_process.get_were_words_guessed())):
-            self.game_is_running = False
-            self.game_won = False
-        elif all(guessing_process.get_were_words_guessed()):
-            self.game_is_running = False
-            self.game_won = True
-
-    def trigger_end_game(self) -> None:
-        if self.game_won:
-            print("Congratulations! You guessed it right!\n")
-        else:
-            print("I'm sorry! You lost. : (")
-            print("The correct answer was"
-                  f" {str(self.guessing_process.get_correct_words())}.\n")
+        best_guess = self.solver.get_best_guess()
+        if best_guess is not None:
+            print(f"Hint: {best_guess}")
 
 
 def main():
-    game_type = input("Choose the game type.\n"
-                      "Options are: 'wordle', 'dordle', 'quordle'.\n")
-    guessing_process = GuessingProcessNoGui(GAME_TYPE_OPTIONS[game_type]())
+    parser = argparse.ArgumentParser(description="Play wordle.")
+    parser.add_argument("--hints", action="store_true",
+                        help="suggest the most informative guess each turn")
+    parser.add_argument("--hard", action="store_true",
+                        help="every guess must agree with earlier feedback")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for choosing the answers")
+    parser.add_argument("--transcript", type=Path, default=None,
+                        help="append a binary transcript of the game to"
+                             " this file")
+    parser.add_argument("--protocol", action="store_true",
+                        help="read guesses from stdin and answer each with"
+                             " one line of pattern codes, playing games"
+                             " back to back")
+    parser.add_argument("--game", default=None,
+                        choices=list(GAME_TYPE_OPTIONS),
+                        help="game type, instead of asking for it")
+    parser.add_argument("--metrics", type=Path, default=None,
+                        help="record hot-path timings and dump them to this"
+                             " file (.json, otherwise Prometheus text)")
+    parser.add_argument("--profile", type=Path, default=None,
+                        help="write a cProfile capture of the session")
+    args = parser.parse_args()
+    with metrics.session(args.metrics, args.profile):
+        if args.protocol:
+            serve_protocol(GAME_TYPE_OPTIONS[args.game or "wordle"](
+                args.hard, args.seed
+                ))
+        else:
+            play(args)
+
+
+def play(args: argparse.Namespace) -> None:
+    game_type = args.game or input(
+        "Choose the game type.\n"
+        f"Options are: {', '.join(map(repr, GAME_TYPE_OPTIONS))}.\n"
+        )
+    guessing_process = GuessingProcessNoGui(
+        GAME_TYPE_OPTIONS[game_type](args.hard, args.seed)
+        )
     game_status = GameStatus(guessing_process)
+    transcript = bytearray()
+    if args.transcript is not None:
+        TranscriptRecorder(transcript, guessing_process, game_type, args.hard)
+    guessing_process.attach(RemainingWordsPrinter())
     print("Welcome to wordle!")
+    if args.hints:
+        if (game_type == "wordle"
+                and get_decision_tree_file().exists()):
+            solver = TreeSolver(guessing_process, DecisionTree())
+        elif game_type == "wordle":
+            solver = EntropySolver(guessing_process)
+        else:
+            solver = JointSolver(guessing_process)
+        guessing_process.attach(HintPrinter(solver))
+        print(f"Hint: {solver.get_best_guess()}")
     while game_status.game_is_running:
         guessing_process.guess_step()
     game_status.trigger_end_game()
+    if args.transcript is not None:
+        append_transcripts(args.transcript, transcript)
 
 
 if __name__ == "__main__":
@@ -1,39 +1,89 @@
 from __future__ import annotations
 
+import argparse
+from pathlib import Path
 from time import sleep
-from tkinter import Button, Entry, Frame, Label, Tk
-from typing import List
-
-from game_type import Dordle, GameType, Quordle, Wordle
-from guessing_process import (GuessingObserver, GuessingProcess,
-                              GuessingProcessGui)
-
-GAME_TYPE_OPTIONS = {
-    "wordle": Wordle,
-    "dordle": Dordle,
-    "quordle": Quordle
-}
+from tkinter import END, Button, Entry, Event, Frame, Label, Tk
+from typing import Callable, List, Optional
+
+import metrics
+from board_view import BoardView, CanvasBoardView, LabelBoardView
+from game_type import (Absurdle, Dordle, Duotrigordle, GameType, Octordle,
+                       Quordle, Wordle, get_word_index)
+from guessing_process import GuessingObserver, GuessingProcess
+from guessing_process_gui import GuessingProcessGui
+from hint_service import HintService
+from word_index import WordIndex
 
 GAME_TYPE: GameType = None  # type: ignore
 
+COMPLETIONS_SHOWN = 5
+LABEL_GRID_MAX_WORDS = 4
+
 wanting_to_play = True
 
 
+class GameGui:
+
+    def __init__(self, root: Tk, game_type: GameType) -> None:
+        self.words_frame = Frame(root)
+        self.bottom_frame = Frame(root)
+
+        self.labels: List[List[List[Label]]] = []
+        self.board_view: BoardView
+        if game_type.get_number_of_words() > LABEL_GRID_MAX_WORDS:
+            self.board_view = CanvasBoardView(self.words_frame, game_type)
+        else:
+            self.labels = generate_labels(self.words_frame, game_type)
+            self.board_view = LabelBoardView(self.labels)
+
+        self.entry = Entry(self.bottom_frame)
+        self.end_print = Label(self.bottom_frame, text="")
+        self.end_print.grid(row=game_type.get_max_guesses() + 1, column=0)
+        self.completions = Label(self.bottom_frame, text="", fg="gray")
+        self.completions.grid(row=game_type.get_max_guesses() + 2, column=0)
+        self.word_index = get_word_index()
+        set_up_autocomplete(self.entry, self.completions,
+                            lambda: self.word_index)
+        self.remaining = Label(self.bottom_frame, text="", fg="gray")
+        self.remaining.grid(row=game_type.get_max_guesses() + 3, column=0)
+        self.hint = Label(self.bottom_frame, text="", fg="gray")
+        self.hint.grid(row=game_type.get_max_guesses() + 4, column=0)
+
+        self.retry_frame = Frame(root)
+        self.retry_yes = Button(self.retry_frame, text="Retry")
+        self.retry_no = Button(self.retry_frame, text="Close")
+        self.retry_yes.grid(row=0, column=0)
+        self.retry_no.grid(row=0, column=1)
+
+        set_up_game_gui(self.words_frame, self.bottom_frame, self.labels,
+                        self.entry, game_type)
+
+    def reset(self) -> None:
+        self.board_view.reset()
+        self.entry.config(state="normal")
+        self.entry.delete(0, END)
+        self.end_print.config(text="")
+        self.completions.config(text="")
+        self.remaining.config(text="")
+        self.hint.config(text="")
+        self.word_index = get_word_index()
+        self.retry_frame.pack_forget()
+
+
 class GameStatus(GuessingObserver):
 
     def __init__(self, guessing_process: GuessingProcess, root: Tk,
-                 end_print: Label, entry: Entry) -> None:
+                 game_gui: GameGui) -> None:
         self.game_is_running = True
         self.guessing_process = guessing_process
         guessing_process.attach(self)
         self.root = root
-        self.end_print = end_print
-        self.entry = entry
-        self.retry_frame = Frame(root)
-        self.retry_yes = Button(self.retry_frame, text="Retry",
-                                command=self.retry)
-        self.retry_no = Button(self.retry_frame, text="Close",
-                               command=self.destroy)
+        self.end_print = game_gui.end_print
+        self.entry = game_gui.entry
+        self.retry_frame = game_gui.retry_frame
+        game_gui.retry_yes.config(command=self.retry)
+        game_gui.retry_no.config(command=self.destroy)
 
     def update(self, guessing_process: GuessingProcess) -> None:
         if (guessing_process.get_number_of_guesses()
@@ -44,8 +94,6 @@ class GameStatus(GuessingObserver):
                 text=("I'm sorry! You lost. : (\nThe correct answer was"
                       f" {str(self.guessing_process.get_correct_words())}.\n")
                 )
-            self.retry_yes.grid(row=GAME_TYPE.get_max_guesses()+2, column=0)
-            self.retry_no.grid(row=GAME_TYPE.get_max_guesses()+2, column=1)
             self.retry_frame.pack()
 
         elif all(guessing_process.get_were_words_guessed()):
@@ -53,8 +101,6 @@ class GameStatus(GuessingObserver):
             self.end_print.config(
                 text="Congratulations! You guessed it right!\n"
                 )
-            self.retry_yes.grid(row=GAME_TYPE.get_max_guesses()+2, column=0)
-            self.retry_no.grid(row=GAME_TYPE.get_max_guesses()+2, column=1)
             self.retry_frame.pack()
 
     def destroy(self) -> None:
@@ -63,59 +109,109 @@ class GameStatus(GuessingObserver):
         self.root.destroy()
 
     def retry(self) -> None:
-        for widget in self.root.winfo_children():
-            widget.destroy()
         self.root.quit()
 
 
-def selection_window():
+class RemainingWordsDisplay(GuessingObserver):
+
+    def __init__(self, guessing_process: GuessingProcess,
+                 remaining: Label) -> None:
+        self.remaining = remaining
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        self.remaining.config(
+            text="Words remaining: " + " ".join(
+                "-" if was_word_guessed else str(count)
+                for count, was_word_guessed
+                in zip(guessing_process.get_remaining_candidates(),
+                       guessing_process.get_were_words_guessed())
+                )
+            )
+
+
+class LegalWordsIndex(GuessingObserver):
+
+    def __init__(self, guessing_process: GuessingProcess,
+                 game_gui: GameGui) -> None:
+        self.game_gui = game_gui
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        hard_mode = guessing_process.get_hard_mode()
+        if hard_mode is not None:
+            self.game_gui.word_index = WordIndex(hard_mode.legal_guesses())
+
+
+def selection_window(hard_mode: bool = False):
     root = Tk()
     root.title("Wordle")
     root.eval('tk::PlaceWindow . center')
 
     def select_wordle():
         global GAME_TYPE
-        GAME_TYPE = Wordle()
+        GAME_TYPE = Wordle(hard_mode)
         root.destroy()
 
     def select_dordle():
         global GAME_TYPE
-        GAME_TYPE = Dordle()
+        GAME_TYPE = Dordle(hard_mode)
         root.destroy()
 
     def select_quordle():
         global GAME_TYPE
-        GAME_TYPE = Quordle()
+        GAME_TYPE = Quordle(hard_mode)
+        root.destroy()
+
+    def select_absurdle():
+        global GAME_TYPE
+        GAME_TYPE = Absurdle(hard_mode)
+        root.destroy()
+
+    def select_octordle():
+        global GAME_TYPE
+        GAME_TYPE = Octordle(hard_mode)
+        root.destroy()
+
+    def select_duotrigordle():
+        global GAME_TYPE
+        GAME_TYPE = Duotrigordle(hard_mode)
         root.destroy()
 
     game_mode_selection = Label(root, text="Select the game mode!")
     wordle = Button(root, text="Wordle", command=select_wordle)
     dordle = Button(root, text="Dordle", command=select_dordle)
     quordle = Button(root, text="Quordle", command=select_quordle)
+    absurdle = Button(root, text="Absurdle", command=select_absurdle)
+    octordle = Button(root, text="Octordle", command=select_octordle)
+    duotrigordle = Button(root, text="Duotrigordle",
+                          command=select_duotrigordle)
 
     game_mode_selection.pack()
     wordle.pack()
     dordle.pack()
     quordle.pack()
+    absurdle.pack()
+    octordle.pack()
+    duotrigordle.pack()
 
     root.mainloop()
 
 
-def main_game(root: Tk):
-
-    words_frame = Frame(root)
-    bottom_frame = Frame(root)
-
-    labels = generate_labels(words_frame, GAME_TYPE)
-
-    entry = Entry(bottom_frame)
-    end_print = Label(bottom_frame, text="")
-    end_print.grid(row=GAME_TYPE.get_max_guesses() + 1, column=0)
-    guessing_process = GuessingProcessGui(GAME_TYPE, root, labels, end_print)
-
-    GameStatus(guessing_process, root, end_print, entry)
-    set_up_game_gui(words_frame, bottom_frame, labels,
-                    entry, GAME_TYPE, guessing_process)
+def main_game(root: Tk, game_gui: GameGui,
+              hint_service: Optional[HintService] = None):
+    game_gui.reset()
+    guessing_process = GuessingProcessGui(GAME_TYPE, root,
+                                          game_gui.board_view,
+                                          game_gui.end_print)
+
+    GameStatus(guessing_process, root, game_gui)
+    RemainingWordsDisplay(guessing_process, game_gui.remaining)
+    if GAME_TYPE.is_hard_mode():
+        LegalWordsIndex(guessing_process, game_gui)
+    if hint_service is not None:
+        hint_service.start(guessing_process)
+    game_gui.entry.bind('<Return>', guessing_process.guess_step)
     root.mainloop()
 
 
@@ -138,25 +234,47 @@ def set_up_game_gui(words_frame: Frame,
                     bottom_frame: Frame,
                     labels: List[List[List[Label]]],
                     entry: Entry,
-                    game_type: GameType,
-                    guessing_process: GuessingProcessGui) -> None:
-    for i in range(game_type.get_max_guesses()):
-        row_of_words = labels[i]
-        for j in range(game_type.get_number_of_words()):
-            word = row_of_words[j]
+                    game_type: GameType) -> None:
+    for i, row_of_words in enumerate(labels):
+        for j, word in enumerate(row_of_words):
             for k in range(5):
                 label = word[k]
                 label.grid(row=i, column=6*j+k)
             label = Label(words_frame, text="  ")
             label.grid(row=i, column=6*(j+1)-1)
     entry.grid(row=game_type.get_max_guesses(), column=0)
-    entry.bind('<Return>', guessing_process.guess_step)
     words_frame.pack()
     bottom_frame.pack()
 
 
+def set_up_autocomplete(entry: Entry, completions: Label,
+                        word_index: Callable[[], WordIndex]) -> None:
+    def update_completions(event: Event) -> None:
+        text = entry.get().lower()
+        if not text:
+            completions.config(text="")
+            return
+        completions.config(
+            text=" ".join(word_index().lookup(text, COMPLETIONS_SHOWN))
+            )
+
+    entry.bind('<KeyRelease>', update_completions, add="+")
+
+
 def main():
-    selection_window()
+    parser = argparse.ArgumentParser(description="Play wordle.")
+    parser.add_argument("--hints", action="store_true",
+                        help="suggest the most informative guess each turn")
+    parser.add_argument("--hard", action="store_true",
+                        help="every guess must agree with earlier feedback")
+    parser.add_argument("--metrics", type=Path, default=None,
+                        help="record hot-path timings and dump them to this"
+                             " file (.json, otherwise Prometheus text)")
+    parser.add_argument("--profile", type=Path, default=None,
+                        help="write a cProfile capture of the session")
+    args = parser.parse_args()
+
+    selection_window(args.hard)
     root = Tk()
 
     def quit_playing():
@@ -169,8 +287,13 @@ def main():
     root.geometry(GAME_TYPE.get_geometry())
     root.eval('tk::PlaceWindow . center')
 
-    while wanting_to_play:
-        main_game(root)
+    game_gui = GameGui(root, GAME_TYPE)
+    hint_service = HintService(root, game_gui.hint) if args.hints else None
+    with metrics.session(args.metrics, args.profile):
+        while wanting_to_play:
+            main_game(root, game_gui, hint_service)
+    if hint_service is not None:
+        hint_service.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+BUCKETS = 40
+DUMP_INTERVAL = 10.0
+METRIC_PREFIX = "wordle"
+
+F = TypeVar("F", bound=Callable)
+
+
+class Histogram:
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.buckets: List[int] = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+
+    def observe(self, nanoseconds: int) -> None:
+        self.buckets[min(nanoseconds.bit_length(), BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += nanoseconds
+
+    def cumulative(self) -> List[int]:
+        counts: List[int] = []
+        running = 0
+        for count in self.buckets:
+            running += count
+            counts.append(running)
+        return counts
+
+
+class Registry:
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+
+    def histogram(self, name: str) -> Histogram:
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        return self.histograms[name]
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self) -> None:
+        for histogram in self.histograms.values():
+            histogram.clear()
+        self.counters.clear()
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum_seconds": histogram.total / 1e9,
+                    "buckets": {
+                        f"{2 ** index / 1e9:g}": count
+                        for index, count in enumerate(histogram.cumulative())
+                        if histogram.buckets[index]
+                        },
+                    }
+                for name, histogram in sorted(self.histograms.items())
+                if histogram.count
+                },
+            "counters": dict(sorted(self.counters.items())),
+            }, indent=1)
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        for name, histogram in sorted(self.histograms.items()):
+            if not histogram.count:
+                continue
+            metric = f"{METRIC_PREFIX}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for index, count in enumerate(histogram.cumulative()):
+                if histogram.buckets[index]:
+                    bound = f"{2 ** index / 1e9:g}"
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum {histogram.total / 1e9}")
+            lines.append(f"{metric}_count {histogram.count}")
+        for name, value in sorted(self.counters.items()):
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Path) -> None:
+        if path.suffix == ".json":
+            text = self.to_json()
+        else:
+            text = self.to_prometheus()
+        partial_file = path.with_name(path.name + ".partial")
+        partial_file.write_text(text)
+        partial_file.replace(path)
+
+
+REGISTRY = Registry()
+
+
+def timed(name: str) -> Callable[[F], F]:
+    def decorate(function: F) -> F:
+        histogram = REGISTRY.histogram(name)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter_ns() - start)
+        return wrapper  # type: ignore
+    return decorate
+
+
+class PeriodicDump:
+
+    def __init__(self, path: Path, interval: float = DUMP_INTERVAL) -> None:
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            REGISTRY.dump(self.path)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        REGISTRY.dump(self.path)
+
+
+@contextmanager
+def session(metrics_path: Optional[Path] = None,
+            profile_path: Optional[Path] = None,
+            interval: float = DUMP_INTERVAL) -> Iterator[None]:
+    dumper = None
+    if metrics_path is not None:
+        REGISTRY.enabled = True
+        dumper = PeriodicDump(metrics_path, interval)
+        dumper.start()
+    profiler = None
+    if profile_path is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        if dumper is not None:
+            dumper.stop()
+            REGISTRY.enabled = False
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game_type import GUESSES, WORDS
+from guessing_process import GuessingObserver, GuessingProcess
+from scoring import NUMBER_OF_PATTERNS, get_pattern_matrix
+from solver import X_LOG_X, legal_guess_mask
+
+JOINT_CHUNK_SIZE = 16
+
+Objective = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def total_information(information: np.ndarray,
+                      remaining: np.ndarray) -> np.ndarray:
+    return information.sum(axis=1)
+
+
+def weakest_board(information: np.ndarray,
+                  remaining: np.ndarray) -> np.ndarray:
+    return information.min(axis=1)
+
+
+def fewest_remaining(information: np.ndarray,
+                     remaining: np.ndarray) -> np.ndarray:
+    return -remaining.sum(axis=1)
+
+
+OBJECTIVES: Dict[str, Objective] = {
+    "information": total_information,
+    "weakest": weakest_board,
+    "remaining": fewest_remaining,
+}
+
+
+def board_statistics(
+        candidate_sets: Sequence[np.ndarray]
+        ) -> Tuple[np.ndarray, np.ndarray]:
+    unique: Dict[bytes, int] = {}
+    distinct_sets: List[np.ndarray] = []
+    board_sets: List[int] = []
+    for candidates in candidate_sets:
+        key = candidates.tobytes()
+        if key not in unique:
+            unique[key] = len(distinct_sets)
+            distinct_sets.append(candidates)
+        board_sets.append(unique[key])
+
+    number_of_sets = len(distinct_sets)
+    sizes = np.array([len(candidates) for candidates in distinct_sets])
+    columns = np.concatenate(distinct_sets)
+    bins = number_of_sets * NUMBER_OF_PATTERNS
+    offsets = (
+        (np.repeat(np.arange(number_of_sets), sizes)
+         * NUMBER_OF_PATTERNS).astype(np.int32)[None, :]
+        + (np.arange(JOINT_CHUNK_SIZE, dtype=np.int32) * bins)[:, None]
+        )
+    indices = np.empty_like(offsets)
+
+    matrix = np.take(get_pattern_matrix(), columns, axis=1)
+    number_of_guesses = matrix.shape[0]
+    information = np.empty((number_of_guesses, number_of_sets))
+    remaining = np.empty((number_of_guesses, number_of_sets))
+    for start in range(0, number_of_guesses, JOINT_CHUNK_SIZE):
+        rows = matrix[start:start + JOINT_CHUNK_SIZE]
+        size = len(rows)
+        np.add(rows, offsets[:size], out=indices[:size])
+        counts = np.bincount(
+            indices[:size].ravel(), minlength=bins * size
+            ).reshape(size, number_of_sets, NUMBER_OF_PATTERNS)
+        information[start:start + size] = (
+            np.log2(sizes) - X_LOG_X[counts].sum(axis=2) / sizes
+            )
+        remaining[start:start + size] = (counts * counts).sum(axis=2) / sizes
+    return information[:, board_sets], remaining[:, board_sets]
+
+
+def suggest_joint(candidate_sets: Sequence[np.ndarray],
+                  objective: str = "information", top: int = 10,
+                  legal: Optional[np.ndarray] = None
+                  ) -> List[Tuple[str, float]]:
+    candidate_sets = [
+        candidates for candidates in candidate_sets if len(candidates)
+        ]
+    if not candidate_sets:
+        return []
+
+    information, remaining = board_statistics(candidate_sets)
+    scores = OBJECTIVES[objective](information, remaining)
+    if legal is not None:
+        scores = np.where(legal, scores, -np.inf)
+    hits = np.zeros(len(GUESSES))
+    for candidates in candidate_sets:
+        hits[candidates] += 1 / len(candidates)
+
+    top = min(top, len(GUESSES) if legal is None else int(legal.sum()))
+    best = np.argpartition(-scores, top - 1)[:top]
+    tied = np.flatnonzero(scores >= scores[best].min())
+    ranked = tied[np.lexsort((-hits[tied], -scores[tied]))]
+    certain = list(dict.fromkeys(
+        WORDS[candidates[0]]
+        for candidates in candidate_sets if len(candidates) == 1
+        ))
+    suggestions = [(GUESSES[index], float(scores[index]))
+                   for index in ranked if GUESSES[index] not in certain]
+    return ([(word, float("inf")) for word in certain] + suggestions)[:top]
+
+
+class JointSolver(GuessingObserver):
+
+    def __init__(self, guessing_process: GuessingProcess,
+                 objective: str = "information", top: int = 10) -> None:
+        if objective not in OBJECTIVES:
+            raise ValueError(f"unknown objective {objective!r}")
+        self.objective = objective
+        self.top = top
+        self.suggestions: List[Tuple[str, float]] = []
+        self.update(guessing_process)
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        board_candidates = guessing_process.get_candidates()
+        self.suggestions = suggest_joint(
+            [
+                board_candidates.get_indices(index)
+                for index, was_word_guessed
+                in enumerate(guessing_process.get_were_words_guessed())
+                if not was_word_guessed
+                ],
+            self.objective, self.top, legal_guess_mask(guessing_process)
+            )
+
+    def get_best_guess(self) -> Optional[str]:
+        if self.suggestions:
+            return self.suggestions[0][0]
+        return None
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from decision_tree import split_by_pattern
+from game_type import GUESSES, WORDS, Wordle
+from scoring import (CACHE_DIR, GUESS_INDEX, SOLVED_PATTERN,
+                     get_pattern_matrix, words_digest)
+from solver import all_candidates, bucket_counts, suggest
+
+OPENERS_PER_TASK = 4
+MAX_DEPTH = 20
+MEMO_LIMIT = 500_000
+
+Policy = Callable[[np.ndarray], int]
+OpenerResult = Tuple[str, int, int, int]
+
+
+def entropy_guess(candidates: np.ndarray) -> int:
+    return GUESS_INDEX[suggest(candidates, 1)[0][0]]
+
+
+def minimax_guess(candidates: np.ndarray) -> int:
+    if len(candidates) <= 2:
+        return int(candidates[0])
+    largest = bucket_counts(candidates).max(axis=1)
+    is_candidate = np.zeros(len(GUESSES), dtype=bool)
+    is_candidate[candidates] = True
+    return int(np.lexsort((~is_candidate, largest))[0])
+
+
+POLICIES: Dict[str, Policy] = {
+    "entropy": entropy_guess,
+    "minimax": minimax_guess,
+}
+
+_memo: Dict[Tuple[str, bytes], int] = {}
+
+
+def _next_guess(strategy: str, candidates: np.ndarray) -> int:
+    key = (strategy, candidates.tobytes())
+    if key not in _memo:
+        if len(_memo) >= MEMO_LIMIT:
+            _memo.clear()
+        _memo[key] = POLICIES[strategy](candidates)
+    return _memo[key]
+
+
+def evaluate_opener(opener: str, strategy: str,
+                    max_guesses: int) -> OpenerResult:
+    matrix = np.asarray(get_pattern_matrix())
+    total = 0
+    worst = 0
+    failures = 0
+    stack = [(all_candidates(), GUESS_INDEX[opener], 1)]
+    while stack:
+        candidates, guess, depth = stack.pop()
+        for pattern, bucket in split_by_pattern(matrix[guess], candidates):
+            if pattern == SOLVED_PATTERN:
+                total += depth
+                worst = max(worst, depth)
+                failures += depth > max_guesses
+            elif depth >= MAX_DEPTH:
+                total += len(bucket) * (depth + 1)
+                worst = MAX_DEPTH + 1
+                failures += len(bucket)
+            else:
+                stack.append((bucket, _next_guess(strategy, bucket),
+                              depth + 1))
+    return opener, total, worst, failures
+
+
+def _evaluate_openers(openers: Sequence[str], strategy: str,
+                      max_guesses: int) -> List[OpenerResult]:
+    return [evaluate_opener(opener, strategy, max_guesses)
+            for opener in openers]
+
+
+def get_checkpoint_file(strategy: str) -> Path:
+    return CACHE_DIR / (f"openers-{strategy}"
+                        f"-{words_digest(GUESSES, WORDS)[:16]}.progress")
+
+
+def read_checkpoint(path: Path) -> Dict[str, OpenerResult]:
+    results: Dict[str, OpenerResult] = {}
+    if path.exists():
+        for line in path.read_text().splitlines():
+            fields = line.split()
+            if len(fields) == 4:
+                results[fields[0]] = (fields[0], int(fields[1]),
+                                      int(fields[2]), int(fields[3]))
+    return results
+
+
+def rank_openers(openers: Sequence[str] = WORDS, strategy: str = "entropy",
+                 max_guesses: int = Wordle().get_max_guesses(),
+                 workers: Optional[int] = None,
+                 openers_per_task: int = OPENERS_PER_TASK,
+                 checkpoint: Optional[Path] = None) -> List[OpenerResult]:
+    if strategy not in POLICIES:
+        raise ValueError(f"unknown strategy {strategy!r}")
+    checkpoint = checkpoint or get_checkpoint_file(strategy)
+    checkpoint.parent.mkdir(parents=True, exist_ok=True)
+    results = read_checkpoint(checkpoint)
+    pending = [opener for opener in openers if opener not in results]
+    tasks = [pending[start:start + openers_per_task]
+             for start in range(0, len(pending), openers_per_task)]
+
+    get_pattern_matrix()
+    with ProcessPoolExecutor(max_workers=workers) as executor, \
+            open(checkpoint, "a") as progress:
+        futures = [
+            executor.submit(_evaluate_openers, task, strategy, max_guesses)
+            for task in tasks
+            ]
+        for future in as_completed(futures):
+            for result in future.result():
+                results[result[0]] = result
+                progress.write(" ".join(map(str, result)) + "\n")
+            progress.flush()
+
+    return sorted((results[opener] for opener in openers),
+                  key=lambda result: (result[1], result[3], result[2],
+                                      result[0]))
+
+
+def print_table(ranked: Sequence[OpenerResult], top: int) -> None:
+    print(f"{'rank':>4}  {'opener':6} {'mean':>6} {'worst':>5}"
+          f" {'fails':>5}")
+    for rank, (opener, total, worst, failures) in enumerate(ranked[:top],
+                                                            1):
+        print(f"{rank:>4}  {opener:6} {total / len(WORDS):6.4f}"
+              f" {worst:>5} {failures:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rank every answer as an opener by playing out all"
+                    " answers with a strategy."
+        )
+    parser.add_argument("--strategy", default="entropy",
+                        choices=list(POLICIES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--openers-per-task", type=int,
+                        default=OPENERS_PER_TASK)
+    parser.add_argument("--limit", type=int, default=None,
+                        help="only evaluate the first N answers")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--restart", action="store_true",
+                        help="discard the checkpoint of an earlier run")
+    args = parser.parse_args()
+
+    checkpoint = get_checkpoint_file(args.strategy)
+    if args.restart and checkpoint.exists():
+        checkpoint.unlink()
+    start = time.perf_counter()
+    ranked = rank_openers(WORDS[:args.limit], args.strategy,
+                          workers=args.workers,
+                          openers_per_task=args.openers_per_task,
+                          checkpoint=checkpoint)
+    elapsed = time.perf_counter() - start
+    print_table(ranked, args.top)
+    print(f"{len(ranked)} openers in {elapsed:.1f} s,"
+          f" checkpoint {checkpoint}")
+
+
+if __name__ == "__main__":
+    main()
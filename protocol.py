@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+
+from game_type import GameType, is_input_valid
+from guessing_process import GuessingProcessNoGui
+
+READ_SIZE = 1 << 16
+INVALID = b"?\n"
+
+
+class ProtocolGame:
+
+    def __init__(self, game_type: GameType) -> None:
+        self.game_type = game_type
+        self.games = 0
+        self.new_game()
+
+    def new_game(self) -> None:
+        self.guessing_process = GuessingProcessNoGui(self.game_type)
+
+    def answer(self, word_input: str) -> bytes:
+        guessing_process = self.guessing_process
+        if not is_input_valid(word_input, guessing_process.get_hard_mode()):
+            return INVALID
+
+        line = " ".join(map(str, guessing_process.make_guess(word_input)))
+        if all(guessing_process.get_were_words_guessed()):
+            line += " W"
+        elif (guessing_process.get_number_of_guesses()
+                >= guessing_process.get_max_guesses()):
+            line += " L " + " ".join(guessing_process.get_correct_words())
+        else:
+            return (line + "\n").encode()
+        self.games += 1
+        self.new_game()
+        return (line + "\n").encode()
+
+
+def _write_all(output_fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(output_fd, view):]
+
+
+def serve_protocol(game_type: GameType, input_fd: int = 0,
+                   output_fd: int = 1) -> int:
+    game = ProtocolGame(game_type)
+    pending = b""
+    while True:
+        chunk = os.read(input_fd, READ_SIZE)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        output = bytearray()
+        for line in lines:
+            word_input = line.strip().decode("ascii", "replace").lower()
+            if word_input:
+                output += game.answer(word_input)
+        _write_all(output_fd, output)
+    word_input = pending.strip().decode("ascii", "replace").lower()
+    if word_input:
+        _write_all(output_fd, game.answer(word_input))
+    return game.games
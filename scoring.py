@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+from game_type import GUESSES, WORDS
+from word_arrays import WORD_LENGTH, WordArrays
+from word_list import CACHE_DIR
+
+GRAY = 0
+YELLOW = 1
+GREEN = 2
+
+NUMBER_OF_PATTERNS = 3 ** WORD_LENGTH
+SOLVED_PATTERN = NUMBER_OF_PATTERNS - 1
+
+CHUNK_SIZE = 256
+
+GUESS_INDEX: Dict[str, int] = {
+    word: index for index, word in enumerate(GUESSES)
+    }
+ANSWER_INDEX: Dict[str, int] = {
+    word: index for index, word in enumerate(WORDS)
+    }
+
+
+def score(word_input: str, correct_word: str) -> int:
+    colors = [GRAY] * WORD_LENGTH
+    available: Dict[str, int] = {}
+    for index, letter in enumerate(correct_word):
+        if word_input[index] == letter:
+            colors[index] = GREEN
+        else:
+            available[letter] = available.get(letter, 0) + 1
+    for index, letter in enumerate(word_input):
+        if colors[index] == GRAY and available.get(letter, 0) > 0:
+            colors[index] = YELLOW
+            available[letter] -= 1
+    return encode_colors(colors)
+
+
+def encode_colors(colors: Sequence[int]) -> int:
+    pattern = 0
+    for index, color in enumerate(colors):
+        pattern += color * 3 ** index
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def decode_pattern(pattern: int) -> Tuple[int, ...]:
+    return tuple((pattern // 3 ** index) % 3 for index in range(WORD_LENGTH))
+
+
+def build_pattern_matrix(guesses: WordArrays,
+                         answers: WordArrays) -> np.ndarray:
+    guess_letters = guesses.letters
+    greens = [
+        guess_letters[:, j, None] == answers.letters[None, :, j]
+        for j in range(WORD_LENGTH)
+        ]
+    same_letter = guess_letters[:, :, None] == guess_letters[:, None, :]
+    answer_counts = answers.letter_counts.T
+
+    patterns = np.zeros(greens[0].shape, dtype=np.uint8)
+    yellows: List[np.ndarray] = []
+    for i in range(WORD_LENGTH):
+        available = answer_counts[guess_letters[:, i]]
+        for j in range(WORD_LENGTH):
+            available -= greens[j] & same_letter[:, i, j, None]
+        for k in range(i):
+            available -= yellows[k] & same_letter[:, i, k, None]
+        yellow = ~greens[i] & (available > 0)
+        yellows.append(yellow)
+        patterns += greens[i] * np.uint8(GREEN * 3 ** i)
+        patterns += yellow * np.uint8(YELLOW * 3 ** i)
+    return patterns
+
+
+def words_digest(guesses: Sequence[str], answers: Sequence[str]) -> str:
+    digest = hashlib.sha256("\n".join(guesses).encode())
+    digest.update(b"\0")
+    digest.update("\n".join(answers).encode())
+    return digest.hexdigest()
+
+
+def get_pattern_matrix_file(guesses: Sequence[str] = GUESSES,
+                            answers: Sequence[str] = WORDS) -> Path:
+    return CACHE_DIR / f"patterns-{words_digest(guesses, answers)[:16]}.npy"
+
+
+@contextmanager
+def build_lock(path: Path) -> Iterator[None]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _build_chunk(partial_file: str, start: int, guesses: WordArrays,
+                 answers: WordArrays) -> Tuple[int, int]:
+    matrix = np.load(partial_file, mmap_mode="r+")
+    end = start + len(guesses)
+    matrix[start:end] = build_pattern_matrix(guesses, answers)
+    matrix.flush()
+    del matrix
+    return start, end
+
+
+def _read_progress(progress_file: Path, rows: int) -> np.ndarray:
+    built = np.zeros(rows, dtype=bool)
+    for line in progress_file.read_text().splitlines():
+        fields = line.split()
+        if len(fields) == 2:
+            built[int(fields[0]):int(fields[1])] = True
+    return built
+
+
+def build_pattern_matrix_file(guesses: Sequence[str],
+                              answers: Sequence[str],
+                              path: Path,
+                              chunk_size: int = CHUNK_SIZE,
+                              workers: Optional[int] = None) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_file = path.with_suffix(".partial.npy")
+    progress_file = path.with_suffix(".progress")
+
+    if partial_file.exists() and progress_file.exists():
+        built = _read_progress(progress_file, len(guesses))
+    else:
+        np.lib.format.open_memmap(
+            partial_file, mode="w+", dtype=np.uint8,
+            shape=(len(guesses), len(answers))
+            ).flush()
+        progress_file.write_text("")
+        built = np.zeros(len(guesses), dtype=bool)
+
+    guess_arrays = WordArrays.from_words(guesses)
+    answer_arrays = WordArrays.from_words(answers)
+    pending = [start for start in range(0, len(guesses), chunk_size)
+               if not built[start:start + chunk_size].all()]
+    with ProcessPoolExecutor(max_workers=workers) as executor, \
+            open(progress_file, "a") as progress:
+        futures = [
+            executor.submit(_build_chunk, str(partial_file), start,
+                            guess_arrays[start:start + chunk_size],
+                            answer_arrays)
+            for start in pending
+            ]
+        for future in as_completed(futures):
+            start, end = future.result()
+            progress.write(f"{start} {end}\n")
+            progress.flush()
+
+    partial_file.replace(path)
+    progress_file.unlink()
+    return path
+
+
+@lru_cache(maxsize=None)
+def get_pattern_matrix() -> np.ndarray:
+    cache_file = get_pattern_matrix_file()
+    if not cache_file.exists():
+        with build_lock(cache_file):
+            if not cache_file.exists():
+                build_pattern_matrix_file(GUESSES, WORDS, cache_file)
+    return np.load(cache_file, mmap_mode="r")
+
+
+def get_patterns(word_input: str, correct_words: List[str]) -> List[int]:
+    guess_index = GUESS_INDEX.get(word_input)
+    answer_indices = [ANSWER_INDEX.get(word) for word in correct_words]
+    if guess_index is None or None in answer_indices:
+        return [score(word_input, word) for word in correct_words]
+    return get_pattern_matrix()[guess_index, answer_indices].tolist()
+
+
+def score_batch(guesses: Sequence[str],
+                answers: Sequence[str]) -> np.ndarray:
+    guess_indices = [GUESS_INDEX.get(word) for word in guesses]
+    answer_indices = [ANSWER_INDEX.get(word) for word in answers]
+    if None in guess_indices or None in answer_indices:
+        return build_pattern_matrix(WordArrays.from_words(guesses),
+                                    WordArrays.from_words(answers))
+    return get_pattern_matrix()[np.ix_(guess_indices, answer_indices)]
+
+
+def score_pairs(guesses: Sequence[str],
+                answers: Sequence[str]) -> np.ndarray:
+    guess_indices = [GUESS_INDEX.get(word) for word in guesses]
+    answer_indices = [ANSWER_INDEX.get(word) for word in answers]
+    if None in guess_indices or None in answer_indices:
+        return np.array([score(word_input, correct_word)
+                         for word_input, correct_word
+                         in zip(guesses, answers)], dtype=np.uint8)
+    return get_pattern_matrix()[guess_indices, answer_indices]
+
+
+def get_pattern(word_input: str, correct_word: str) -> int:
+    guess_index = GUESS_INDEX.get(word_input)
+    answer_index = ANSWER_INDEX.get(correct_word)
+    if guess_index is None or answer_index is None:
+        return score(word_input, correct_word)
+    return int(get_pattern_matrix()[guess_index, answer_index])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build the cached guess x answer pattern matrix."
+        )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+    cache_file = get_pattern_matrix_file()
+    with build_lock(cache_file):
+        print(build_pattern_matrix_file(GUESSES, WORDS, cache_file,
+                                        args.chunk_size, args.workers))
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import metrics
+from game_status import GameStatus
+from game_type import GAME_TYPE_OPTIONS, get_word_index, is_input_valid
+from guessing_process import GuessingProcessNoGui
+from scoring import get_pattern_matrix
+from session_snapshot import SnapshotSlab
+
+MAX_LINE_LENGTH = 4096
+BACKLOG = 4096
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def _session_id(request: Dict[str, Any]) -> int:
+    session_id = request.get("session")
+    if not isinstance(session_id, int) or isinstance(session_id, bool):
+        raise ProtocolError("session must be an integer")
+    return session_id
+
+
+class Session:
+
+    def __init__(self, game_type_name: str, hard_mode: bool = False,
+                 guessing_process: Optional[GuessingProcessNoGui] = None
+                 ) -> None:
+        if (not isinstance(game_type_name, str)
+                or game_type_name not in GAME_TYPE_OPTIONS):
+            raise ProtocolError(f"unknown game type {game_type_name!r}")
+        self.game_type_name = game_type_name
+        self.guessing_process = guessing_process or GuessingProcessNoGui(
+            GAME_TYPE_OPTIONS[game_type_name](hard_mode)
+            )
+        self.game_status = GameStatus(self.guessing_process)
+        self.last_active = time.monotonic()
+
+    def guess(self, word_input: str) -> Dict[str, Any]:
+        if not self.game_status.game_is_running:
+            raise ProtocolError("game is over")
+        self.last_active = time.monotonic()
+        process = self.guessing_process
+        if not is_input_valid(word_input, process.get_hard_mode()):
+            raise ProtocolError("invalid word")
+
+        patterns = process.make_guess(word_input)
+        reply: Dict[str, Any] = {
+            "patterns": patterns,
+            "solved": process.get_were_words_guessed(),
+            "remaining": process.get_remaining_candidates(),
+            "guesses": process.get_number_of_guesses(),
+            "finished": not self.game_status.game_is_running,
+        }
+        if not self.game_status.game_is_running:
+            reply["won"] = self.game_status.game_won
+            reply["answers"] = process.get_correct_words()
+        return reply
+
+
+class GameServer:
+
+    def __init__(self, park_after: Optional[float] = None) -> None:
+        if park_after is not None and park_after <= 0:
+            raise ValueError("park_after must be positive")
+        self.sessions: Dict[int, Session] = {}
+        self.park_after = park_after
+        self.slabs: Dict[str, SnapshotSlab] = {}
+        self.parked: Dict[int, Tuple[str, int]] = {}
+        self._session_ids = itertools.count(1)
+        get_word_index()
+        get_pattern_matrix()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        operation = request.get("op")
+        if operation == "new":
+            hard_mode = request.get("hard", False)
+            if not isinstance(hard_mode, bool):
+                raise ProtocolError("hard must be true or false")
+            session = Session(request.get("game", "wordle"), hard_mode)
+            session_id = next(self._session_ids)
+            self.sessions[session_id] = session
+            process = session.guessing_process
+            return {
+                "session": session_id,
+                "boards": len(process.get_correct_words()),
+                "max_guesses": process.get_max_guesses(),
+            }
+        if operation == "guess":
+            session_id = _session_id(request)
+            reply = self._get_session(session_id).guess(
+                str(request.get("word", "")).lower()
+                )
+            if reply["finished"]:
+                del self.sessions[session_id]
+            return reply
+        if operation == "close":
+            session_id = _session_id(request)
+            if session_id in self.parked:
+                game_type_name, slot = self.parked.pop(session_id)
+                self.slabs[game_type_name].release(slot)
+                return {}
+            self._get_session(session_id)
+            del self.sessions[session_id]
+            return {}
+        if operation == "stats":
+            return {"sessions": len(self.sessions),
+                    "parked": len(self.parked)}
+        raise ProtocolError(f"unknown op {operation!r}")
+
+    def _get_session(self, session_id: int) -> Session:
+        if session_id in self.parked:
+            game_type_name, slot = self.parked.pop(session_id)
+            self.sessions[session_id] = Session(
+                game_type_name,
+                guessing_process=self.slabs[game_type_name].unpark(slot)
+                )
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise ProtocolError("unknown session")
+        return session
+
+    def park_idle_sessions(self) -> int:
+        if self.park_after is None:
+            return 0
+        deadline = time.monotonic() - self.park_after
+        idle = [session_id for session_id, session in self.sessions.items()
+                if session.last_active < deadline]
+        for session_id in idle:
+            session = self.sessions.pop(session_id)
+            name = session.game_type_name
+            if name not in self.slabs:
+                self.slabs[name] = SnapshotSlab(
+                    session.guessing_process.game_type
+                    )
+            self.parked[session_id] = (
+                name, self.slabs[name].park(session.guessing_process)
+                )
+        return len(idle)
+
+    async def park_periodically(self) -> None:
+        while self.park_after is not None:
+            await asyncio.sleep(self.park_after / 2)
+            self.park_idle_sessions()
+
+    def handle_line(self, line: bytes) -> bytes:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ProtocolError("request must be a JSON object")
+            reply = {"ok": True, **self.handle(request)}
+        except (ProtocolError, ValueError) as error:
+            reply = {"ok": False, "error": str(error)}
+        except Exception:
+            logging.exception("Failed to handle %r", line)
+            reply = {"ok": False, "error": "internal error"}
+        return json.dumps(reply, separators=(",", ":")).encode() + b"\n"
+
+    async def serve_client(self, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(self.handle_line(line))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765,
+                unix_path: Optional[str] = None,
+                park_after: Optional[float] = None) -> None:
+    game_server = GameServer(park_after)
+    parking = asyncio.ensure_future(game_server.park_periodically())
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(
+            game_server.serve_client, unix_path, limit=MAX_LINE_LENGTH,
+            backlog=BACKLOG
+            )
+    else:
+        server = await asyncio.start_server(
+            game_server.serve_client, host, port, limit=MAX_LINE_LENGTH,
+            backlog=BACKLOG
+            )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        parking.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve many headless games over line-delimited JSON."
+        )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None,
+                        help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--park-after", type=float, default=None,
+                        help="pack sessions idle for this many seconds into"
+                             " compact snapshots")
+    parser.add_argument("--metrics", type=Path, default=None,
+                        help="record hot-path timings and dump them to this"
+                             " file (.json, otherwise Prometheus text)")
+    parser.add_argument("--profile", type=Path, default=None,
+                        help="write a cProfile capture of the session")
+    args = parser.parse_args()
+    if args.park_after is not None and args.park_after <= 0:
+        parser.error("--park-after must be positive")
+    with metrics.session(args.metrics, args.profile):
+        try:
+            asyncio.run(serve(args.host, args.port, args.unix,
+                              args.park_after))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
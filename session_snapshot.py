@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from itertools import groupby
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from game_type import GUESSES, WORDS, GameType
+from guessing_process import GuessingProcessNoGui
+from scoring import ANSWER_INDEX, GUESS_INDEX
+from transcript import HARD_MODE_FLAG, game_type_code, game_type_from_code
+
+SLAB_CAPACITY = 1024
+
+
+def snapshot_dtype(game_type: GameType) -> np.dtype:
+    return np.dtype([
+        ("game_type", "u1"),
+        ("flags", "u1"),
+        ("boards", "u1"),
+        ("guesses", "u1"),
+        ("solved", "<u4"),
+        ("answers", "<u2", (game_type.get_number_of_words(),)),
+        ("history", "<u2", (game_type.get_max_guesses(),)),
+        ])
+
+
+def pack_session(guessing_process: GuessingProcessNoGui,
+                 record: Optional[np.void] = None) -> np.void:
+    game_type = guessing_process.game_type
+    if record is None:
+        record = np.zeros((), dtype=snapshot_dtype(game_type))[()]
+    guesses = guessing_process.get_guesses()
+    record["game_type"] = game_type_code(game_type)
+    record["flags"] = HARD_MODE_FLAG * game_type.is_hard_mode()
+    record["boards"] = game_type.get_number_of_words()
+    record["guesses"] = len(guesses)
+    record["solved"] = sum(
+        1 << index for index, was_word_guessed
+        in enumerate(guessing_process.get_were_words_guessed())
+        if was_word_guessed
+        )
+    record["answers"] = [ANSWER_INDEX[word]
+                         for word in guessing_process.get_correct_words()]
+    history = record["history"]
+    history[:len(guesses)] = [GUESS_INDEX[word] for word in guesses]
+    history[len(guesses):] = 0
+    return record
+
+
+def restore_session(record: np.void) -> GuessingProcessNoGui:
+    game_type = game_type_from_code(int(record["game_type"]),
+                                    int(record["boards"]),
+                                    int(record["flags"]))
+    guessing_process = GuessingProcessNoGui(
+        game_type, [WORDS[index] for index in record["answers"].tolist()]
+        )
+    for guess in record["history"][:record["guesses"]].tolist():
+        guessing_process.make_guess(GUESSES[guess])
+    solved = [bool(record["solved"] >> index & 1)
+              for index in range(record["boards"])]
+    if solved != guessing_process.get_were_words_guessed():
+        raise ValueError("snapshot does not match its guess history")
+    return guessing_process
+
+
+class SnapshotSlab:
+
+    def __init__(self, game_type: GameType, path: Optional[Path] = None,
+                 capacity: int = SLAB_CAPACITY) -> None:
+        self.dtype = snapshot_dtype(game_type)
+        self.path = path
+        if path is not None and path.exists():
+            self.records = np.load(path, mmap_mode="r+")
+            if self.records.dtype != self.dtype:
+                raise ValueError(f"{path} holds snapshots of another"
+                                 " game type")
+        else:
+            self.records = self._allocate(capacity)
+        self.free: List[int] = [
+            slot for slot in range(len(self.records) - 1, -1, -1)
+            if not self.records[slot]["boards"]
+            ]
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros(capacity, dtype=self.dtype)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return np.lib.format.open_memmap(self.path, mode="w+",
+                                         dtype=self.dtype,
+                                         shape=(capacity,))
+
+    def _grow(self) -> None:
+        capacity = len(self.records)
+        if self.path is None:
+            records = self._allocate(2 * capacity)
+            records[:capacity] = self.records
+        else:
+            old = np.array(self.records)
+            del self.records
+            records = self._allocate(2 * capacity)
+            records[:capacity] = old
+        self.records = records
+        self.free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def park(self, guessing_process: GuessingProcessNoGui) -> int:
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        pack_session(guessing_process, self.records[slot])
+        return slot
+
+    def unpark(self, slot: int) -> GuessingProcessNoGui:
+        guessing_process = restore_session(self.records[slot])
+        self.release(slot)
+        return guessing_process
+
+    def release(self, slot: int) -> None:
+        self.records[slot] = 0
+        self.free.append(slot)
+
+    def __len__(self) -> int:
+        return len(self.records) - len(self.free)
+
+    def flush(self) -> None:
+        if isinstance(self.records, np.memmap):
+            self.records.flush()
+
+
+def save_snapshots(path: Path,
+                   guessing_processes: List[GuessingProcessNoGui]) -> None:
+    with open(path, "wb") as output:
+        for dtype, group in groupby(
+                guessing_processes,
+                key=lambda process: snapshot_dtype(process.game_type)):
+            processes = list(group)
+            records = np.zeros(len(processes), dtype=dtype)
+            for record, guessing_process in zip(records, processes):
+                pack_session(guessing_process, record)
+            np.save(output, records)
+
+
+def load_snapshots(path: Path) -> List[GuessingProcessNoGui]:
+    guessing_processes: List[GuessingProcessNoGui] = []
+    with open(path, "rb") as source:
+        size = path.stat().st_size
+        while source.tell() < size:
+            guessing_processes += [
+                restore_session(record) for record in np.load(source)
+                ]
+    return guessing_processes
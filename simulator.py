@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from decision_tree import DecisionTree, TreeSolver, get_decision_tree_file
+from game_statistics import (GameStatistics, SnapshotWriter,
+                             StatisticsCollector)
+from game_status import GameStatus
+from game_type import GAME_TYPE_OPTIONS, WORDS, GameType
+from guessing_process import GuessingProcessNoGui
+from multi_board_solver import JointSolver
+from scoring import get_pattern_matrix
+from solver import EntropySolver
+from transcript import TranscriptRecorder, append_transcripts
+
+GAMES_PER_TASK = 64
+
+
+class Strategy(ABC):
+
+    @abstractmethod
+    def start(self, guessing_process: GuessingProcessNoGui) -> None:
+        pass
+
+    @abstractmethod
+    def next_guess(self) -> str:
+        pass
+
+
+class EntropyStrategy(Strategy):
+
+    def start(self, guessing_process: GuessingProcessNoGui) -> None:
+        self.solver = EntropySolver(guessing_process, top=1)
+
+    def next_guess(self) -> str:
+        unsolved = [
+            (len(candidates), suggestions[0][0])
+            for candidates, suggestions in zip(self.solver.candidates,
+                                               self.solver.suggestions)
+            if suggestions
+            ]
+        return min(unsolved)[1]
+
+
+class RandomCandidateStrategy(Strategy):
+
+    def __init__(self, seed: int = 0) -> None:
+        self.rng = random.Random(seed)
+
+    def start(self, guessing_process: GuessingProcessNoGui) -> None:
+        self.guessing_process = guessing_process
+
+    def next_guess(self) -> str:
+        process = self.guessing_process
+        unsolved = [
+            index for index, was_word_guessed
+            in enumerate(process.get_were_words_guessed())
+            if not was_word_guessed
+            ]
+        board = unsolved[self.rng.randrange(len(unsolved))]
+        candidates = process.get_candidates().get_indices(board)
+        return WORDS[candidates[self.rng.randrange(len(candidates))]]
+
+
+class JointStrategy(Strategy):
+
+    def __init__(self, objective: str = "information") -> None:
+        self.objective = objective
+
+    def start(self, guessing_process: GuessingProcessNoGui) -> None:
+        self.solver = JointSolver(guessing_process, self.objective, top=1)
+
+    def next_guess(self) -> str:
+        return self.solver.get_best_guess()  # type: ignore
+
+
+class TreeStrategy(Strategy):
+
+    def __init__(self) -> None:
+        self.tree = DecisionTree()
+
+    def start(self, guessing_process: GuessingProcessNoGui) -> None:
+        if len(guessing_process.get_correct_words()) != 1:
+            raise ValueError("the decision tree only plays wordle")
+        self.solver = TreeSolver(guessing_process, self.tree)
+
+    def next_guess(self) -> str:
+        return self.solver.get_best_guess()  # type: ignore
+
+
+STRATEGY_OPTIONS = {
+    "entropy": EntropyStrategy,
+    "random": RandomCandidateStrategy,
+    "joint": JointStrategy,
+    "tree": TreeStrategy
+}
+
+
+def strategy_error(game_type_name: str,
+                   strategy_name: str) -> Optional[str]:
+    if strategy_name != "tree":
+        return None
+    if GAME_TYPE_OPTIONS[game_type_name]().get_number_of_words() != 1:
+        return f"the tree strategy cannot play {game_type_name}"
+    if not get_decision_tree_file().exists():
+        return ("the decision tree has not been built yet,"
+                " run python decision_tree.py first")
+    return None
+
+
+def game_words(game_type: GameType, game: int, seed: int,
+               every_word: bool) -> List[str]:
+    rng = random.Random(seed * 1_000_003 + game)
+    number_of_words = game_type.get_number_of_words()
+    if every_word:
+        first = [WORDS[game]]
+        number_of_words -= 1
+    else:
+        first = []
+    return first + [WORDS[rng.randrange(len(WORDS))]
+                    for i in range(number_of_words)]
+
+
+def play_game(game_type: GameType, strategy: Strategy,
+              correct_words: List[str],
+              statistics: Optional[GameStatistics] = None,
+              game_type_name: Optional[str] = None,
+              transcript: Optional[bytearray] = None) -> Tuple[bool, int]:
+    guessing_process = GuessingProcessNoGui(game_type, correct_words)
+    game_status = GameStatus(guessing_process)
+    if statistics is not None and game_type_name is not None:
+        StatisticsCollector(statistics, game_type_name, guessing_process)
+    if transcript is not None:
+        TranscriptRecorder(transcript, guessing_process, game_type_name,
+                           game_type.is_hard_mode())
+    strategy.start(guessing_process)
+    while game_status.game_is_running:
+        guessing_process.make_guess(strategy.next_guess())
+    return game_status.game_won, guessing_process.get_number_of_guesses()
+
+
+def _play_games(game_type_name: str, strategy_name: str, games: range,
+                seed: int, every_word: bool,
+                record: bool = False) -> Tuple[GameStatistics, bytes]:
+    game_type = GAME_TYPE_OPTIONS[game_type_name]()
+    strategy = STRATEGY_OPTIONS[strategy_name]()
+    statistics = GameStatistics()
+    transcript = bytearray() if record else None
+    for game in games:
+        play_game(game_type, strategy,
+                  game_words(game_type, game, seed, every_word),
+                  statistics, game_type_name, transcript)
+    return statistics, bytes(transcript or b"")
+
+
+def simulate(game_type_name: str, strategy_name: str = "entropy",
+             games: Optional[int] = None, seed: int = 0,
+             workers: Optional[int] = None,
+             statistics: Optional[GameStatistics] = None,
+             snapshot: Optional[Path] = None,
+             transcripts: Optional[Path] = None) -> Dict[str, object]:
+    error = strategy_error(game_type_name, strategy_name)
+    if error is not None:
+        raise ValueError(error)
+    every_word = games is None
+    total = len(WORDS) if games is None else games
+    tasks = [range(start, min(start + GAMES_PER_TASK, total))
+             for start in range(0, total, GAMES_PER_TASK)]
+
+    get_pattern_matrix()
+    start = time.perf_counter()
+    run_statistics = GameStatistics()
+    writer = None
+    if snapshot is not None:
+        writer = SnapshotWriter(statistics or run_statistics, snapshot)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_play_games, game_type_name, strategy_name,
+                            task, seed, every_word, transcripts is not None)
+            for task in tasks
+            ]
+        for future in as_completed(futures):
+            partial, transcript = future.result()
+            if transcripts is not None:
+                append_transcripts(transcripts, transcript)
+            run_statistics.merge(partial)
+            if statistics is not None:
+                statistics.merge(partial)
+            if writer is not None:
+                writer.maybe_flush()
+    elapsed = time.perf_counter() - start
+    if writer is not None:
+        writer.flush()
+
+    report = run_statistics.summary(game_type_name)
+    report["strategy"] = strategy_name
+    report["games_per_second"] = report["games"] / elapsed  # type: ignore
+    return report
+
+
+def print_report(report: Dict[str, object]) -> None:
+    print(f"{report['game_type']} ({report['strategy']}):"
+          f" {report['games']} games,"
+          f" win rate {report['win_rate']:.2%},"
+          f" mean guesses {report['mean_guesses']:.3f},"
+          f" {report['games_per_second']:.1f} games/s")
+    for guesses, count in report["distribution"].items():  # type: ignore
+        print(f"  {guesses:>2}: {count}")
+    print(f"   X: {report['losses']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play many headless games with a strategy."
+        )
+    parser.add_argument("game_types", nargs="*",
+                        help="any of "
+                             f"{', '.join(GAME_TYPE_OPTIONS)}; defaults to"
+                             " every game type the strategy can play")
+    parser.add_argument("--strategy", default="entropy",
+                        choices=list(STRATEGY_OPTIONS))
+    parser.add_argument("--games", type=int, default=None,
+                        help="play N seeded random games instead of"
+                             " every answer")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--snapshot", type=Path, default=None,
+                        help="periodically write merged statistics to this"
+                             " .npz file, adding to it if it exists")
+    parser.add_argument("--transcripts", type=Path, default=None,
+                        help="append a binary transcript of every game to"
+                             " this file")
+    parser.add_argument("--hardest", type=int, default=0,
+                        help="list the N answers solved least often")
+    args = parser.parse_args()
+    if not args.game_types:
+        args.game_types = [
+            game_type_name for game_type_name in GAME_TYPE_OPTIONS
+            if args.strategy != "tree"
+            or GAME_TYPE_OPTIONS[game_type_name]().get_number_of_words() == 1
+            ]
+    for game_type_name in args.game_types:
+        if game_type_name not in GAME_TYPE_OPTIONS:
+            parser.error(f"unknown game type {game_type_name!r}")
+        error = strategy_error(game_type_name, args.strategy)
+        if error is not None:
+            parser.error(error)
+
+    statistics = GameStatistics()
+    if args.snapshot is not None and args.snapshot.exists():
+        statistics = GameStatistics.load(args.snapshot)
+    for game_type_name in args.game_types:
+        print_report(simulate(game_type_name, args.strategy, args.games,
+                              args.seed, args.workers, statistics,
+                              args.snapshot, args.transcripts))
+    for word, solve_rate, mean_guesses in statistics.hardest_words(
+            args.hardest):
+        print(f"{word}: solved {solve_rate:.2%},"
+              f" {mean_guesses:.2f} guesses when solved")
+
+
+if __name__ == "__main__":
+    main()
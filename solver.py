@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from game_type import GUESSES, WORDS
+from guessing_process import GuessingObserver, GuessingProcess
+from scoring import NUMBER_OF_PATTERNS, get_pattern_matrix
+
+BUCKET_CHUNK_SIZE = 64
+SORTED_ENTROPY_LIMIT = 48
+
+X_LOG_X = np.zeros(len(WORDS) + 1)
+X_LOG_X[1:] = np.arange(1, len(WORDS) + 1) * np.log2(
+    np.arange(1, len(WORDS) + 1)
+    )
+
+
+def all_candidates() -> np.ndarray:
+    return np.arange(len(WORDS))
+
+
+def bucket_counts(candidates: np.ndarray) -> np.ndarray:
+    matrix = get_pattern_matrix()
+    if len(candidates) < matrix.shape[1]:
+        matrix = matrix[:, candidates]
+
+    number_of_guesses = matrix.shape[0]
+    counts = np.empty((number_of_guesses, NUMBER_OF_PATTERNS),
+                      dtype=np.int64)
+    offsets = (np.arange(BUCKET_CHUNK_SIZE, dtype=np.int32)
+               * NUMBER_OF_PATTERNS)[:, None]
+    for start in range(0, number_of_guesses, BUCKET_CHUNK_SIZE):
+        rows = matrix[start:start + BUCKET_CHUNK_SIZE]
+        size = len(rows)
+        counts[start:start + size] = np.bincount(
+            (rows + offsets[:size]).ravel(),
+            minlength=NUMBER_OF_PATTERNS * size
+            ).reshape(size, NUMBER_OF_PATTERNS)
+    return counts
+
+
+def sorted_bucket_sums(candidates: np.ndarray) -> np.ndarray:
+    rows = np.sort(get_pattern_matrix()[:, candidates], axis=1)
+    starts = np.ones(rows.shape, dtype=bool)
+    np.not_equal(rows[:, 1:], rows[:, :-1], out=starts[:, 1:])
+    run_starts = np.flatnonzero(starts)
+    lengths = np.diff(np.append(run_starts, rows.size))
+    row_starts = np.searchsorted(run_starts,
+                                 np.arange(len(rows)) * rows.shape[1])
+    return np.add.reduceat(X_LOG_X[lengths], row_starts)
+
+
+def entropies(candidates: np.ndarray) -> np.ndarray:
+    total = len(candidates)
+    if total <= SORTED_ENTROPY_LIMIT:
+        sums = sorted_bucket_sums(candidates)
+    else:
+        sums = X_LOG_X[bucket_counts(candidates)].sum(axis=1)
+    return np.log2(total) - sums / total
+
+
+def legal_guess_mask(
+        guessing_process: GuessingProcess
+        ) -> Optional[np.ndarray]:
+    hard_mode = guessing_process.get_hard_mode()
+    if hard_mode is None:
+        return None
+    return hard_mode.legal_mask()
+
+
+def suggest(candidates: np.ndarray, top: int = 10,
+            legal: Optional[np.ndarray] = None) -> List[Tuple[str, float]]:
+    if len(candidates) == 0:
+        return []
+    if len(candidates) == 1:
+        return [(WORDS[candidates[0]], 0.0)]
+
+    information = entropies(candidates)
+    if legal is not None:
+        information = np.where(legal, information, -np.inf)
+    is_candidate = np.zeros(len(GUESSES), dtype=bool)
+    is_candidate[candidates] = True
+
+    top = min(top, len(GUESSES) if legal is None else int(legal.sum()))
+    best = np.argpartition(-information, top - 1)[:top]
+    threshold = information[best].min()
+    tied = np.flatnonzero(information >= threshold)
+    ranked = tied[np.lexsort((~is_candidate[tied], -information[tied]))]
+    return [(GUESSES[index], float(information[index]))
+            for index in ranked[:top]]
+
+
+@lru_cache(maxsize=None)
+def opening_suggestions(top: int = 10) -> List[Tuple[str, float]]:
+    return suggest(all_candidates(), top)
+
+
+class EntropySolver(GuessingObserver):
+
+    def __init__(self, guessing_process: Optional[GuessingProcess] = None,
+                 top: int = 10) -> None:
+        self.top = top
+        self.candidates: List[np.ndarray] = []
+        self.suggestions: List[List[Tuple[str, float]]] = []
+        if guessing_process is not None:
+            self.reset(guessing_process)
+            guessing_process.attach(self)
+
+    def reset(self, guessing_process: GuessingProcess) -> None:
+        self.candidates = [
+            all_candidates() for word in guessing_process.get_correct_words()
+            ]
+        opening = opening_suggestions(self.top)
+        self.suggestions = [opening for board in self.candidates]
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        board_candidates = guessing_process.get_candidates()
+        were_words_guessed = guessing_process.get_were_words_guessed()
+        legal = legal_guess_mask(guessing_process)
+        for index in range(len(self.candidates)):
+            if were_words_guessed[index]:
+                self.candidates[index] = self.candidates[index][:0]
+                self.suggestions[index] = []
+                continue
+            self.candidates[index] = board_candidates.get_indices(index)
+            self.suggestions[index] = suggest(self.candidates[index],
+                                              self.top, legal)
+
+    def get_best_guess(self) -> Optional[str]:
+        for suggestions in self.suggestions:
+            if suggestions:
+                return suggestions[0][0]
+        return None
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from game_type import WORDS  # noqa: E402
+from scoring import (GRAY, GREEN, YELLOW, build_pattern_matrix,  # noqa: E402
+                     encode_colors, score)
+from word_arrays import WordArrays  # noqa: E402
+
+REPEATED_LETTERS = [
+    "speed", "abide", "geese", "eerie", "abbey", "llama", "allay", "error",
+    "mamma", "sassy", "tweet", "otter", "belle", "shell", "every", "needs",
+    ]
+
+
+@pytest.mark.parametrize("word_input, correct_word, colors", [
+    ("speed", "abide", [GRAY, GRAY, YELLOW, GRAY, YELLOW]),
+    ("geese", "eerie", [GRAY, GREEN, YELLOW, GRAY, GREEN]),
+    ("llama", "allay", [YELLOW, GREEN, YELLOW, GRAY, YELLOW]),
+    ("error", "otter", [YELLOW, GRAY, GRAY, YELLOW, GREEN]),
+    ("abbey", "abbey", [GREEN] * 5),
+])
+def test_score_known_patterns(word_input, correct_word, colors):
+    assert score(word_input, correct_word) == encode_colors(colors)
+
+
+def test_matrix_matches_score_on_repeated_letters():
+    matrix = build_pattern_matrix(WordArrays.from_words(REPEATED_LETTERS),
+                                  WordArrays.from_words(REPEATED_LETTERS))
+    for i, word_input in enumerate(REPEATED_LETTERS):
+        for j, correct_word in enumerate(REPEATED_LETTERS):
+            assert matrix[i, j] == score(word_input, correct_word)
+
+
+def test_matrix_matches_score_on_sampled_words():
+    rng = random.Random(0)
+    guesses = rng.sample(WORDS, 200) + REPEATED_LETTERS
+    answers = rng.sample(WORDS, 200) + REPEATED_LETTERS
+    matrix = build_pattern_matrix(WordArrays.from_words(guesses),
+                                  WordArrays.from_words(answers))
+    expected = [[score(word_input, correct_word) for correct_word in answers]
+                for word_input in guesses]
+    assert matrix.tolist() == expected
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import argparse
+import struct
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from game_type import GAME_TYPE_OPTIONS, GUESSES, WORDS, GameType, NBoardGame
+from guessing_process import (GuessingObserver, GuessingProcess,
+                              GuessingProcessNoGui)
+from scoring import (ANSWER_INDEX, GUESS_INDEX, build_pattern_matrix,
+                     get_pattern_matrix, get_patterns)
+from word_arrays import ANSWER_ARRAYS, GUESS_ARRAYS
+
+MAGIC = b"WRDT"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sH")
+RECORD_HEADER = struct.Struct("<BBBB")
+
+GAME_TYPE_NAMES = list(GAME_TYPE_OPTIONS)
+N_BOARD_GAME = 255
+HARD_MODE_FLAG = 1
+WON_FLAG = 2
+
+
+class Record(NamedTuple):
+    game_type: int
+    boards: int
+    guesses: int
+    flags: int
+    answers: int
+    entries: int
+
+
+def encode_game(game_type_name: Optional[str], hard_mode: bool, won: bool,
+                answers: List[str], guesses: List[str],
+                patterns: List[List[int]]) -> bytes:
+    game_type = (GAME_TYPE_NAMES.index(game_type_name)
+                 if game_type_name in GAME_TYPE_OPTIONS else N_BOARD_GAME)
+    flags = HARD_MODE_FLAG * hard_mode | WON_FLAG * won
+    boards = len(answers)
+    data = bytearray(RECORD_HEADER.pack(game_type, boards, len(guesses),
+                                        flags))
+    data += struct.pack(f"<{boards}H",
+                        *[ANSWER_INDEX[word] for word in answers])
+    entry = struct.Struct(f"<H{boards}B")
+    for word_input, row in zip(guesses, patterns):
+        data += entry.pack(GUESS_INDEX[word_input], *row)
+    return bytes(data)
+
+
+class TranscriptRecorder(GuessingObserver):
+
+    def __init__(self, transcript: bytearray,
+                 guessing_process: GuessingProcess,
+                 game_type_name: Optional[str] = None,
+                 hard_mode: bool = False) -> None:
+        self.transcript = transcript
+        self.game_type_name = game_type_name
+        self.hard_mode = hard_mode
+        self.answers = list(guessing_process.get_correct_words())
+        self.patterns: List[List[int]] = []
+        guessing_process.attach(self)
+
+    def update(self, guessing_process: GuessingProcess) -> None:
+        guesses = guessing_process.get_guesses()
+        correct_words = guessing_process.get_correct_words()
+        self.patterns.append(get_patterns(guesses[-1], correct_words))
+        won = all(guessing_process.get_were_words_guessed())
+        if won or len(guesses) >= guessing_process.get_max_guesses():
+            self.transcript += encode_game(self.game_type_name,
+                                           self.hard_mode, won, self.answers,
+                                           guesses, self.patterns)
+
+
+def append_transcripts(path: Path, transcript: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as output:
+        if output.tell() == 0:
+            output.write(FILE_HEADER.pack(MAGIC, VERSION))
+        output.write(transcript)
+
+
+def read_transcripts(path: Path) -> Tuple[np.ndarray, List[Record]]:
+    data = path.read_bytes()
+    magic, version = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} transcript")
+    records: List[Record] = []
+    offset = FILE_HEADER.size
+    unpack = RECORD_HEADER.unpack_from
+    while offset < len(data):
+        game_type, boards, guesses, flags = unpack(data, offset)
+        answers = offset + RECORD_HEADER.size
+        entries = answers + 2 * boards
+        records.append(Record(game_type, boards, guesses, flags, answers,
+                              entries))
+        offset = entries + guesses * (2 + boards)
+    return np.frombuffer(data, dtype=np.uint8), records
+
+
+def _uint16(data: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    low = data[offsets].astype(np.intp)
+    return low | data[offsets + 1].astype(np.intp) << 8
+
+
+def transcript_pairs(data: np.ndarray, records: List[Record]
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    guess_indices: List[np.ndarray] = []
+    answer_indices: List[np.ndarray] = []
+    patterns: List[np.ndarray] = []
+    for boards in sorted(set(record.boards for record in records)):
+        group = [record for record in records
+                 if record.boards == boards
+                 and record.game_type not in ADVERSARIAL_GAME_TYPES]
+        if not group:
+            continue
+        counts = np.array([record.guesses for record in group])
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        step = np.arange(counts.sum()) - first
+        entries = (np.repeat([record.entries for record in group], counts)
+                   + step * (2 + boards))
+        answers = np.repeat([record.answers for record in group], counts)
+        guesses = _uint16(data, entries)
+        for board in range(boards):
+            guess_indices.append(guesses)
+            answer_indices.append(_uint16(data, answers + 2 * board))
+            patterns.append(data[entries + 2 + board])
+    if not patterns:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty, empty.astype(np.uint8)
+    return (np.concatenate(guess_indices), np.concatenate(answer_indices),
+            np.concatenate(patterns))
+
+
+def verify(path: Path, rebuild: bool = False) -> Tuple[int, int]:
+    data, records = read_transcripts(path)
+    guesses, answers, patterns = transcript_pairs(data, records)
+    if rebuild:
+        used, rows = np.unique(guesses, return_inverse=True)
+        expected = build_pattern_matrix(GUESS_ARRAYS[used],
+                                        ANSWER_ARRAYS)[rows, answers]
+    else:
+        expected = np.asarray(get_pattern_matrix())[guesses, answers]
+    return len(patterns), int(np.count_nonzero(expected != patterns))
+
+
+def game_type_code(game_type: GameType) -> int:
+    for code, name in enumerate(GAME_TYPE_NAMES):
+        if type(game_type) is GAME_TYPE_OPTIONS[name]:
+            return code
+    return N_BOARD_GAME
+
+
+def game_type_from_code(code: int, boards: int, flags: int) -> GameType:
+    hard_mode = bool(flags & HARD_MODE_FLAG)
+    if code == N_BOARD_GAME:
+        return NBoardGame(boards, hard_mode)
+    return GAME_TYPE_OPTIONS[GAME_TYPE_NAMES[code]](hard_mode)
+
+
+def game_type_of(record: Record) -> GameType:
+    return game_type_from_code(record.game_type, record.boards,
+                               record.flags)
+
+
+def replay(path: Path) -> Tuple[int, int]:
+    data, records = read_transcripts(path)
+    raw = data.tobytes()
+    mismatches = 0
+    for record in records:
+        answers = struct.unpack_from(f"<{record.boards}H", raw,
+                                     record.answers)
+        guessing_process = GuessingProcessNoGui(
+            game_type_of(record), [WORDS[index] for index in answers]
+            )
+        entry = struct.Struct(f"<H{record.boards}B")
+        matches = True
+        for guess in range(record.guesses):
+            guess_index, *patterns = entry.unpack_from(
+                raw, record.entries + guess * entry.size
+                )
+            if guessing_process.make_guess(GUESSES[guess_index]) != patterns:
+                matches = False
+        won = all(guessing_process.get_were_words_guessed())
+        if not matches or won != bool(record.flags & WON_FLAG):
+            mismatches += 1
+    return len(records), mismatches
+
+
+ADVERSARIAL_GAME_TYPES = frozenset(
+    code for code, name in enumerate(GAME_TYPE_NAMES)
+    if GAME_TYPE_OPTIONS[name]().is_adversarial()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check recorded game transcripts against the scorer."
+        )
+    parser.add_argument("transcripts", type=Path)
+    parser.add_argument("--rebuild", action="store_true",
+                        help="score from scratch instead of the cached"
+                             " pattern matrix")
+    parser.add_argument("--engine", action="store_true",
+                        help="also replay every game through the game"
+                             " engine")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pairs, mismatches = verify(args.transcripts, args.rebuild)
+    elapsed = time.perf_counter() - start
+    print(f"{pairs} scored pairs, {mismatches} mismatches,"
+          f" {pairs / max(elapsed, 1e-9):,.0f} pairs/s")
+    if args.engine:
+        start = time.perf_counter()
+        games, mismatches = replay(args.transcripts)
+        elapsed = time.perf_counter() - start
+        print(f"{games} games replayed, {mismatches} mismatches,"
+              f" {games / max(elapsed, 1e-9):,.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from word_list import WORD_LENGTH, get_answers, get_guesses
+
+ALPHABET_SIZE = 26
+
+
+def encode_words(words: Sequence[str]) -> np.ndarray:
+    joined = "".join(words).encode("ascii")
+    letters = np.frombuffer(joined, dtype=np.uint8) - ord("a")
+    return letters.reshape(len(words), WORD_LENGTH)
+
+
+class WordArrays:
+
+    def __init__(self, letters: np.ndarray) -> None:
+        self.letters = letters
+        self.letter_counts = np.zeros((len(letters), ALPHABET_SIZE),
+                                      dtype=np.uint8)
+        rows = np.arange(len(letters))
+        for position in range(letters.shape[1]):
+            self.letter_counts[rows, letters[:, position]] += 1
+
+    @classmethod
+    def from_words(cls, words: Sequence[str]) -> WordArrays:
+        return cls(encode_words(words))
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+    def __getitem__(self, index: slice) -> WordArrays:
+        sliced = WordArrays.__new__(WordArrays)
+        sliced.letters = self.letters[index]
+        sliced.letter_counts = self.letter_counts[index]
+        return sliced
+
+
+GUESS_ARRAYS = WordArrays.from_words(get_guesses())
+ANSWER_ARRAYS = GUESS_ARRAYS[:len(get_answers())]
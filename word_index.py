@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import FrozenSet, Iterable, List
+
+WILDCARDS = "?_."
+ALPHABET_SIZE = 26
+
+
+class WordIndex:
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self._sorted: List[str] = sorted(set(word for word in words if word))
+        self._words: FrozenSet[str] = frozenset(self._sorted)
+
+        length = len(self._sorted[0]) if self._sorted else 0
+        self._all = (1 << len(self._sorted)) - 1
+        self._position_masks: List[List[int]] = []
+        for position in range(length):
+            bits = [0] * ALPHABET_SIZE
+            for index, word in enumerate(self._sorted):
+                bits[ord(word[position]) - ord("a")] |= 1 << index
+            self._position_masks.append(bits)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._words
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __iter__(self):
+        return iter(self._sorted)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        start = bisect_left(self._sorted, prefix)
+        completions: List[str] = []
+        for word in self._sorted[start:start + limit]:
+            if not word.startswith(prefix):
+                break
+            completions.append(word)
+        return completions
+
+    def count_prefix(self, prefix: str) -> int:
+        start = bisect_left(self._sorted, prefix)
+        end = bisect_left(self._sorted, prefix + "{")
+        return end - start
+
+    def matching(self, pattern: str, limit: int = 10) -> List[str]:
+        mask = self._all
+        for position, letter in enumerate(pattern):
+            if letter in WILDCARDS:
+                continue
+            if (position >= len(self._position_masks)
+                    or not "a" <= letter <= "z"):
+                return []
+            mask &= self._position_masks[position][ord(letter) - ord("a")]
+
+        matches: List[str] = []
+        while mask and len(matches) < limit:
+            lowest = mask & -mask
+            matches.append(self._sorted[lowest.bit_length() - 1])
+            mask ^= lowest
+        return matches
+
+    def lookup(self, text: str, limit: int = 10) -> List[str]:
+        if any(letter in WILDCARDS for letter in text):
+            return self.matching(text, limit)
+        return self.complete(text, limit)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+ANSWERS_FILE = PACKAGE_DIR / "wordle-answers-alphabetical.txt"
+ALLOWED_GUESSES_FILE = PACKAGE_DIR / "wordle-allowed-guesses.txt"
+CACHE_DIR = PACKAGE_DIR / ".cache"
+
+WORD_LENGTH = 5
+
+
+class WordLists:
+
+    def __init__(self, answers: List[str], guesses: List[str]) -> None:
+        self.answers = answers
+        self.guesses = guesses
+
+
+def _read_words(path: Path) -> List[str]:
+    with open(path) as file:
+        return [word for word in file.read().split("\n") if word]
+
+
+def _parse_text_files() -> Tuple[List[str], List[str]]:
+    answers = _read_words(ANSWERS_FILE)
+    guesses = list(answers)
+    if ALLOWED_GUESSES_FILE.exists():
+        known = set(answers)
+        guesses += [
+            word for word in _read_words(ALLOWED_GUESSES_FILE)
+            if word not in known
+            ]
+    return answers, guesses
+
+
+@lru_cache(maxsize=None)
+def load_word_lists() -> WordLists:
+    return WordLists(*_parse_text_files())
+
+
+def get_answers() -> List[str]:
+    return load_word_lists().answers
+
+
+def get_guesses() -> List[str]:
+    return load_word_lists().guesses
@@ -0,0 +1,80 @@
+from tkinter import Label
+from typing import List
+
+from metrics import timed
+from scoring import (GRAY, GREEN, NUMBER_OF_PATTERNS, YELLOW, decode_pattern,
+                     get_patterns)
+from word_painter import WordPainter, bcolors
+
+GUI_COLORS = {
+    GREEN: "#27c31d",
+    YELLOW: "orange",
+    GRAY: "gray"
+}
+TK_TEMPLATES = [
+    tuple(GUI_COLORS[color] for color in decode_pattern(pattern))
+    for pattern in range(NUMBER_OF_PATTERNS)
+    ]
+LETTER_FONT = "Helvetica 18 bold"
+EMPTY_CELL = "⬜"
+
+
+def configure_command(label: Label, text: str, color: str,
+                      font: str = LETTER_FONT) -> str:
+    return (f"{label} configure -text {{{text}}} -fg {{{color}}}"
+            f" -font {{{font}}}")
+
+
+@timed("put_painted_words_in_gui")
+def put_painted_words_in_gui(word_input: str,
+                             correct_words: List[str],
+                             were_words_guessed: List[bool],
+                             guess_number: int,
+                             labels: List[List[Label]]) -> None:
+    patterns = get_patterns(word_input, correct_words)
+    commands: List[str] = []
+    for index, pattern in enumerate(patterns):
+        word_painter = _WordPainterGui(word_input, pattern, labels[index])
+        if were_words_guessed[index]:
+            commands += word_painter.solved_commands()
+            continue
+        commands += word_painter.word_commands()
+    labels[0][0].tk.eval("\n".join(commands))
+
+
+def reset_labels(labels: List[List[List[Label]]], color: str,
+                 font: str) -> None:
+    labels[0][0][0].tk.eval("\n".join(
+        configure_command(label, EMPTY_CELL, color, font)
+        for row_of_words in labels
+        for word in row_of_words
+        for label in word
+        ))
+
+
+class _WordPainterGui(WordPainter):
+
+    COLORS = GUI_COLORS
+
+    def __init__(self, word_input: str, pattern: int,
+                 labels: List[Label]) -> None:
+        self.word_input = word_input
+        self.colors = TK_TEMPLATES[pattern]
+        self._canvas = labels
+
+    def get_solved(self) -> str:
+        return f"{bcolors.OKGREEN}*****{bcolors.ENDC}"
+
+    def solved_commands(self) -> List[str]:
+        return [configure_command(label, "*", self.COLORS[GREEN])
+                for label in self._canvas]
+
+    def get_painted_word(self) -> str:
+        return self.word_input.upper()
+
+    def word_commands(self) -> List[str]:
+        return [
+            configure_command(label, letter.upper(), color)
+            for label, letter, color in zip(self._canvas, self.word_input,
+                                            self.colors)
+            ]